@@ -2,16 +2,24 @@
 15-Puzzle Game Entry Point
 --------------------------
 This script initializes the GUI for the 15-puzzle game and starts the application.
+
+Run ``python main.py solve [options]`` to solve boards headlessly instead (see
+src/cli.py); that path never imports tkinter or the image libraries.
 """
 
 import logging
-import tkinter as tk
-from src.ui.game_interface import GameInterface
+import sys
 
 logging.basicConfig(level=logging.INFO)
 
 def main():
     """Main function to start the game."""
+    if sys.argv[1:2] == ["solve"]:
+        from src.cli import main as solve_main
+        sys.exit(solve_main(sys.argv[2:]))
+
+    import tkinter as tk
+    from src.ui.game_interface import GameInterface
     root = tk.Tk()
     game = GameInterface(root)
     game.run()
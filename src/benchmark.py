@@ -0,0 +1,187 @@
+# src/benchmark.py
+"""
+Solver Benchmark
+----------------
+Runs an engine/heuristic combination over a reproducible instance set and
+writes per-instance search statistics to JSON, so runs can be compared across
+engines, heuristics and commits.
+
+Instance sets:
+    walk:N      seeded random walks of N moves from the goal (moderate difficulty)
+    random      seeded, uniformly random solvable boards (hard)
+    PATH        a file with one board per line, e.g. Korf's 100 instances. The last
+                16 numbers of each line are the board; with --goal korf (default)
+                boards are read against Korf's blank-first goal and rotated.
+
+Example:
+    python -m src.benchmark --instances walk:40 --count 50 --engine ida \\
+        --heuristic walking_distance --output bench.json --baseline previous.json
+"""
+import argparse
+import json
+import logging
+import platform
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .puzzle.board import CELLS, GOAL, NEIGHBORS, find_blank, pack, slide
+from .puzzle.heuristics import HEURISTICS
+from .puzzle.limits import SearchLimitExceeded
+from .puzzle.puzzle_state import PuzzleState
+from .puzzle.solver import ENGINES, PuzzleSolver
+
+
+def random_walk_boards(count: int, moves: int, seed: int) -> List[int]:
+    """Boards reached by random walks from the goal that never undo a move."""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board, blank, previous = GOAL, find_blank(GOAL), -1
+        for _ in range(moves):
+            target = rng.choice([cell for cell in NEIGHBORS[blank] if cell != previous])
+            board, blank, previous = slide(board, blank, target), target, blank
+        boards.append(board)
+    return boards
+
+
+def random_boards(count: int, seed: int) -> List[int]:
+    """Uniformly random solvable boards."""
+    rng = random.Random(seed)
+    boards = []
+    while len(boards) < count:
+        tiles = list(range(CELLS))
+        rng.shuffle(tiles)
+        state = PuzzleState([tiles[i:i + 4] for i in range(0, CELLS, 4)])
+        if state.is_solvable():
+            boards.append(state.to_packed())
+    return boards
+
+
+def load_boards(path: Path, goal: str = "korf") -> List[int]:
+    """Reads one board per line; blank lines and '#' comments are skipped.
+
+    Korf's instances use the goal ``0 1 2 ... 15``. Rotating the board by 180
+    degrees and relabelling tile t as 16 - t maps that goal onto ours, and
+    preserves optimal solution lengths.
+    """
+    boards = []
+    for line in path.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        tiles = [int(value) for value in line.split()][-CELLS:]
+        if sorted(tiles) != list(range(CELLS)):
+            raise ValueError(f"Invalid board in {path}: {line}")
+        if goal == "korf":
+            tiles = [CELLS - tile if tile else 0 for tile in reversed(tiles)]
+        boards.append(pack(tiles))
+    return boards
+
+
+def instance_set(spec: str, count: int, seed: int, goal: str) -> List[int]:
+    if spec.startswith("walk:"):
+        return random_walk_boards(count, int(spec[len("walk:"):]), seed)
+    if spec == "random":
+        return random_boards(count, seed)
+    return load_boards(Path(spec), goal)[:count]
+
+
+def run(boards: Sequence[int], engine: str, heuristic: str, node_limit: Optional[int] = None,
+        time_limit: Optional[float] = None, profile: bool = False) -> List[Dict]:
+    """Solves each board in this process and returns one record per board."""
+    results = []
+    for index, board in enumerate(boards):
+        solver = PuzzleSolver(PuzzleState.from_packed(board), engine=engine, heuristic=heuristic,
+                              node_limit=node_limit, time_limit=time_limit, profile=profile)
+        if not PuzzleState._is_solvable(solver.initial_state.state):
+            status = "unsolvable"
+        else:
+            try:
+                status = "solved" if solver.solve() is not None else "failed"
+            except SearchLimitExceeded:
+                status = "limit_exceeded"
+        record = {"index": index, "board": f"{board:016x}", "status": status}
+        record.update(solver.stats.to_dict())
+        results.append(record)
+        logging.info(f"[{index + 1}/{len(boards)}] {status} length={record['solution_length']} "
+                     f"nodes={record['nodes_expanded']} time={record['elapsed']:.3f}s")
+    return results
+
+
+def summarize(results: Sequence[Dict]) -> Dict:
+    solved = [result for result in results if result["status"] == "solved"]
+    elapsed = sum(result["elapsed"] for result in results)
+    expanded = sum(result["nodes_expanded"] for result in results)
+    return {
+        "instances": len(results),
+        "solved": len(solved),
+        "total_elapsed": elapsed,
+        "total_nodes_expanded": expanded,
+        "expansions_per_second": expanded / elapsed if elapsed > 0 else 0.0,
+        "mean_length": sum(result["solution_length"] for result in solved) / len(solved) if solved else None,
+    }
+
+
+def compare(report: Dict, baseline: Dict) -> List[str]:
+    """Describes differences against a baseline report, matching boards."""
+    previous = {result["board"]: result for result in baseline["results"]}
+    lines = []
+    for result in report["results"]:
+        before = previous.get(result["board"])
+        if before is None:
+            continue
+        if result["status"] == before["status"] == "solved" \
+                and result["solution_length"] != before["solution_length"]:
+            lines.append(f"board {result['board']}: length {before['solution_length']} -> "
+                         f"{result['solution_length']}")
+    summary, before = report["summary"], baseline["summary"]
+    for key in ("total_nodes_expanded", "total_elapsed"):
+        if before[key]:
+            lines.append(f"{key}: {before[key]:.6g} -> {summary[key]:.6g} ({summary[key] / before[key]:.2f}x)")
+    return lines
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the 15-puzzle solver engines.")
+    parser.add_argument("--instances", default="walk:40", help="walk:N, random, or a file of boards")
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--goal", choices=("korf", "standard"), default="korf",
+                        help="goal convention of boards read from a file")
+    parser.add_argument("--engine", choices=ENGINES, default="ida")
+    parser.add_argument("--heuristic", choices=HEURISTICS, default="manhattan")
+    parser.add_argument("--node-limit", type=int)
+    parser.add_argument("--time-limit", type=float)
+    parser.add_argument("--profile", action="store_true", help="also time the heuristic and track peak memory")
+    parser.add_argument("--output", type=Path, default=Path("bench_output.json"))
+    parser.add_argument("--baseline", type=Path, help="earlier report to compare against")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    boards = instance_set(args.instances, args.count, args.seed, args.goal)
+    results = run(boards, args.engine, args.heuristic, args.node_limit, args.time_limit, args.profile)
+    report = {
+        "engine": args.engine,
+        "heuristic": args.heuristic,
+        "instances": args.instances,
+        "count": len(boards),
+        "seed": args.seed,
+        "node_limit": args.node_limit,
+        "time_limit": args.time_limit,
+        "python": platform.python_version(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "summary": summarize(results),
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    print(json.dumps(report["summary"], indent=2))
+
+    if args.baseline:
+        for line in compare(report, json.loads(args.baseline.read_text())):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
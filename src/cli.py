@@ -0,0 +1,131 @@
+# src/cli.py
+"""
+Headless Solver
+---------------
+Reads boards from a file or stdin and writes one JSON line per board to
+stdout as soon as it is solved. Only the solver core is imported, so start-up
+is quick and no GUI libraries (tkinter, OpenCV, Pillow, NumPy) are needed.
+
+Each input line holds the tiles of one board, row-major, separated by spaces
+or commas, with 0 for the blank; the board size follows from the tile count.
+Blank lines and '#' comments are skipped. Each output line holds the board's
+input index, its tiles, the status, the solution length, the moves as the
+directions the blank travels (R, D, L, U), the elapsed time and the search
+statistics. With several workers, lines come out in completion order.
+Lines that cannot be parsed, and boards the engine cannot take, get the
+status "invalid" and an "error" message; the rest of the input is still
+solved.
+
+Example:
+    python -m src.puzzle.generator --count 100 --depth 40 --output boards.txt
+    python -m src.cli boards.txt --engine ida --heuristic walking_distance --workers 4 > results.jsonl
+"""
+import argparse
+import json
+import logging
+import sys
+from itertools import count
+from math import isqrt
+from typing import IO, Iterator, Optional, Sequence, Union
+
+from .puzzle.batch import INVALID, BatchResult, solve_board, solve_many
+from .puzzle.board import bits_for, unpack
+from .puzzle.heuristics import HEURISTICS, get_heuristic
+from .puzzle.puzzle_state import PuzzleState
+from .puzzle.solver import ENGINES
+
+
+def parse_board(line: str) -> Optional[PuzzleState]:
+    """Parses one input line; returns None for blank and comment lines."""
+    line = line.split("#", 1)[0].replace(",", " ").strip()
+    if not line:
+        return None
+    try:
+        tiles = [int(value) for value in line.split()]
+    except ValueError:
+        raise ValueError(f"Invalid board: {line}") from None
+    size = isqrt(len(tiles))
+    if size < 2 or size * size != len(tiles) or sorted(tiles) != list(range(len(tiles))):
+        raise ValueError(f"Invalid board: {line}")
+    return PuzzleState([tiles[i:i + size] for i in range(0, len(tiles), size)])
+
+
+def read_boards(stream: IO[str]) -> Iterator[Union[PuzzleState, ValueError]]:
+    """Yields boards lazily, so input is consumed as fast as it is solved.
+
+    A malformed line yields its ValueError instead of ending the stream.
+    """
+    for line in stream:
+        try:
+            board = parse_board(line)
+        except ValueError as e:
+            yield e
+            continue
+        if board is not None:
+            yield board
+
+
+def to_record(result: BatchResult, size: Optional[int]) -> dict:
+    """``size`` is None when the input line held no board."""
+    return {
+        "index": result.index,
+        "board": None if size is None else unpack(result.board, size * size, bits_for(size)),
+        "status": result.status,
+        "length": result.length,
+        "moves": None if result.solution is None else str(result.solution),
+        "elapsed": result.elapsed,
+        "stats": None if result.stats is None else result.stats.to_dict(),
+        "error": result.error,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Solve sliding-puzzle boards without a GUI and write JSON lines.")
+    parser.add_argument("input", nargs="?", default="-", help="file of boards, one per line ('-' for stdin)")
+    parser.add_argument("--engine", choices=ENGINES, default="ida")
+    parser.add_argument("--heuristic", choices=HEURISTICS, default="manhattan")
+    parser.add_argument("--node-limit", type=int)
+    parser.add_argument("--time-limit", type=float, help="seconds per board")
+    parser.add_argument("--memory-limit", type=float, help="MB of A* nodes per board before it falls back to IDA*")
+    parser.add_argument("--workers", type=int, default=1, help="solve in a process pool of this size")
+    parser.add_argument("--verbose", action="store_true", help="log solver progress to stderr")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+    stream = sys.stdin if args.input == "-" else open(args.input)
+    inputs = {}  # position among the boards solved -> (input index, board size)
+    positions = count()
+    memory_limit = None if args.memory_limit is None else int(args.memory_limit * (1 << 20))
+
+    def write(result: BatchResult, size: Optional[int]) -> None:
+        sys.stdout.write(json.dumps(to_record(result, size)) + "\n")
+        sys.stdout.flush()
+
+    def boards() -> Iterator[PuzzleState]:
+        for index, board in enumerate(read_boards(stream)):
+            if isinstance(board, ValueError):
+                write(BatchResult(index, 0, INVALID, error=str(board)), None)
+                continue
+            inputs[next(positions)] = (index, board.size)
+            yield board
+
+    try:
+        if args.workers > 1:
+            results = solve_many(boards(), args.engine, args.heuristic, args.workers,
+                                 args.node_limit, args.time_limit, memory_limit)
+        else:
+            heuristic = get_heuristic(args.heuristic)
+            results = (solve_board(index, board.to_packed(), board.size, args.engine, heuristic,
+                                   args.node_limit, args.time_limit, memory_limit)
+                       for index, board in enumerate(boards()))
+        for result in results:
+            result.index, size = inputs.pop(result.index)
+            write(result, size)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
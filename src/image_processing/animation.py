@@ -0,0 +1,106 @@
+# src/image_processing/animation.py
+"""
+Animation Export
+----------------
+Renders a solution to a GIF or MP4 file one frame at a time. States can come
+from any iterable, including a generator, and every frame is gathered into
+the same buffer and written out before the next one is rendered, so memory
+use does not grow with the length of the solution.
+
+GIFs are written with a single palette computed once from the source image.
+Every frame is a rearrangement of the same tiles, so the tiles are quantized
+once and each frame is merged directly from palette indices.
+"""
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Iterator, List, Union
+
+import cv2
+import numpy as np
+from PIL import GifImagePlugin, Image
+
+from .image_handler import ImageHandler, grid_view, merge_grid
+from ..puzzle.puzzle_state import PuzzleState
+
+VIDEO_CODECS = {".mp4": "mp4v", ".avi": "MJPG"}
+BLANK_INDEX = 255  # palette entry reserved for the white blank tile
+
+
+def _flat(state: PuzzleState) -> List[int]:
+    return [tile for row in state.state for tile in row]
+
+
+def render_frames(handler: ImageHandler, states: Iterable[PuzzleState]) -> Iterator[np.ndarray]:
+    """Yields the BGR image of every state; each frame reuses the previous one's buffer."""
+    for state in states:
+        yield handler.merge_tiles(_flat(state))
+
+
+def _export_video(handler: ImageHandler, states: Iterable[PuzzleState], path: Path, fps: float) -> int:
+    frames = 0
+    writer = None
+    try:
+        for frame in render_frames(handler, states):
+            if writer is None:
+                height, width = frame.shape[:2]
+                fourcc = cv2.VideoWriter_fourcc(*VIDEO_CODECS[path.suffix.lower()])
+                writer = cv2.VideoWriter(str(path), fourcc, fps, (width, height))
+                if not writer.isOpened():
+                    raise ValueError(f"Could not open a video writer for {path}")
+            writer.write(frame)
+            frames += 1
+    finally:
+        if writer is not None:
+            writer.release()
+    return frames
+
+
+def _export_gif(handler: ImageHandler, states: Iterable[PuzzleState], path: Path, fps: float) -> int:
+    n = handler.grid_size
+    rgb = cv2.cvtColor(handler.original_image, cv2.COLOR_BGR2RGB)
+    quantized = Image.fromarray(rgb).quantize(BLANK_INDEX)
+    palette = quantized.getpalette()[:3 * BLANK_INDEX]
+    palette += [0] * (3 * BLANK_INDEX - len(palette)) + [255, 255, 255]
+
+    # Palette-index version of handler.tile_stack.
+    tile_height, tile_width = handler.tile_stack.shape[1:3]
+    stack = np.empty((n * n + 1, tile_height, tile_width), dtype=np.uint8)
+    stack[0] = BLANK_INDEX
+    stack[1:].reshape(n, n, tile_height, tile_width)[...] = grid_view(np.asarray(quantized), n)
+    buffer = np.empty((tile_height * n, tile_width * n), dtype=np.uint8)
+    duration = int(round(1000 / fps))
+
+    frames = 0
+    with open(path, "wb") as handle:
+        for state in states:
+            merge_grid(stack, _flat(state), buffer, n)
+            frame = Image.frombuffer("P", (buffer.shape[1], buffer.shape[0]), buffer, "raw", "P", 0, 1)
+            frame.putpalette(palette)
+            if not frames:
+                header, _ = GifImagePlugin.getheader(frame, info={"loop": 0, "duration": duration, "optimize": False})
+                handle.write(b"".join(header))
+            for chunk in GifImagePlugin.getdata(frame, duration=duration):
+                handle.write(chunk)
+            frames += 1
+        handle.write(b";")  # GIF trailer
+    return frames
+
+
+def export_animation(handler: ImageHandler, states: Iterable[PuzzleState],
+                     path: Union[str, Path], fps: float = 4.0) -> int:
+    """Writes one frame per state to a .gif, .mp4 or .avi file and returns the frame count."""
+    if not handler.tiles:
+        raise ValueError("No tiles available. Split an image first.")
+    path = Path(path)
+    suffix = path.suffix.lower()
+    # Check for a first state before a file is opened, so no empty file is left behind.
+    states = iter(states)
+    first = next(states, None)
+    if first is None:
+        raise ValueError("No states to animate.")
+    states = chain([first], states)
+    if suffix == ".gif":
+        return _export_gif(handler, states, path, fps)
+    if suffix in VIDEO_CODECS:
+        return _export_video(handler, states, path, fps)
+    raise ValueError(f"Unsupported animation format '{suffix}'. Expected .gif, .mp4 or .avi.")
@@ -1,90 +1,203 @@
 # src/image_processing/image_handler.py
+import hashlib
+import os
+from pathlib import Path
 from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
+from PIL import Image
+
+DEFAULT_TILE_CACHE = Path(__file__).resolve().parents[2] / "data" / "tiles"
+# Decoder scale factors, largest first. JPEGs are scaled while decoding, so a
+# large photo costs a fraction of the time and memory of a full decode.
+REDUCED_READS = ((8, cv2.IMREAD_REDUCED_COLOR_8), (4, cv2.IMREAD_REDUCED_COLOR_4),
+                 (2, cv2.IMREAD_REDUCED_COLOR_2))
+
+
+def grid_view(image: np.ndarray, n: int) -> np.ndarray:
+    """View of an image as an (n, n, tile_height, tile_width, ...) grid of tiles; nothing is copied."""
+    height, width = image.shape[:2]
+    return image.reshape(n, height // n, n, width // n, *image.shape[2:]).swapaxes(1, 2)
+
+
+def merge_grid(stack: np.ndarray, tile_order: List[int], out: np.ndarray, n: int) -> np.ndarray:
+    """Writes ``stack[tile]`` for every cell of ``tile_order`` into ``out`` with one gather."""
+    order = np.asarray(tile_order, dtype=np.intp).reshape(n, n)
+    if order.min() < 0 or order.max() >= len(stack):
+        raise ValueError("Invalid tile order. Tile numbers out of range.")
+    # 'clip' lets take write straight into the strided view instead of a temporary.
+    np.take(stack, order, axis=0, out=grid_view(out, n), mode='clip')
+    return out
+
+
+def read_reduced(path: str, target_size: Tuple[int, int]) -> Optional[np.ndarray]:
+    """Reads an image at the smallest 1/2, 1/4 or 1/8 scale that still covers ``target_size``."""
+    try:
+        with Image.open(path) as image:
+            width, height = image.size  # read from the header only
+    except OSError:
+        return cv2.imread(path)
+    # EXIF orientation may swap the axes after decoding, so both must cover the target.
+    for factor, flag in REDUCED_READS:
+        if min(width, height) // factor >= max(target_size):
+            return cv2.imread(path, flag)
+    return cv2.imread(path)
+
+
+class TileCache:
+    """Tile stacks on disk, keyed by the image file's contents, the target size and the grid size.
+
+    Once the files exceed ``max_bytes`` the least recently used ones are
+    deleted; a hit refreshes a file's modification time.
+    """
+
+    def __init__(self, directory: os.PathLike = DEFAULT_TILE_CACHE, max_bytes: int = 256 << 20):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(path: str, target_size: Tuple[int, int], grid_size: int) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        return f"{digest.hexdigest()[:32]}-{target_size[0]}x{target_size[1]}-{grid_size}"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        path = self.directory / f"{key}.npy"
+        try:
+            stack = np.load(path)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return stack
+
+    def put(self, key: str, stack: np.ndarray) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary name first so readers never see a partial file.
+        temporary = self.directory / f"{key}.{os.getpid()}.tmp.npy"
+        np.save(temporary, stack)
+        os.replace(temporary, self.directory / f"{key}.npy")
+        self.prune()
+
+    def prune(self) -> None:
+        """Deletes the least recently used files until the rest fit in ``max_bytes``."""
+        files = []
+        for path in self.directory.glob("*.npy"):
+            try:
+                status = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            files.append((status.st_mtime, status.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
 
 
 class ImageHandler:
-    def __init__(self):
+    def __init__(self, grid_size: int = 4, tile_cache: Optional[TileCache] = None):
+        self.grid_size = grid_size
+        self.tile_cache = tile_cache
         self.original_image = None
         self.tiles = []
+        self.tile_stack: Optional[np.ndarray] = None
+        self._merged: Optional[np.ndarray] = None
+        self._cache_key: Optional[str] = None
+        self._cached_stack: Optional[np.ndarray] = None
         self.tile_size = (0, 0)
 
     def load_image(self, path: str, target_size: Tuple[int, int] = (300, 300)) -> bool:
-        """Load and resize image."""
+        """Load and resize image.
+
+        With a tile cache, an image that was split before at this size is
+        not decoded at all; split_image then reuses the cached tiles.
+        """
         try:
-            self.original_image = cv2.imread(path)
+            # Resize to target size, rounded down so the grid divides it evenly
+            n = self.grid_size
+            target_size = (target_size[0] - target_size[0] % n, target_size[1] - target_size[1] % n)
+            self._cache_key = self._cached_stack = None
+            if self.tile_cache is not None:
+                self._cache_key = self.tile_cache.key(path, target_size, n)
+                self._cached_stack = self.tile_cache.get(self._cache_key)
+            if self._cached_stack is not None:
+                tile_height, tile_width = self._cached_stack.shape[1:3]
+                self.original_image = np.ascontiguousarray(
+                    self._cached_stack[1:].reshape(n, n, tile_height, tile_width, 3).swapaxes(1, 2)
+                ).reshape(n * tile_height, n * tile_width, 3)
+                self.tile_size = (tile_width, tile_height)
+                return True
+
+            self.original_image = read_reduced(path, target_size)
             if self.original_image is None:
                 raise ValueError(f"Failed to load image from {path}")
-                
-            # Resize to target size
             self.original_image = cv2.resize(self.original_image, target_size)
             
             # Calculate tile size
             height, width = self.original_image.shape[:2]
-            self.tile_size = (width // 4, height // 4)
+            self.tile_size = (width // n, height // n)
             
             return True
         except Exception as e:
             print(f"Error loading image: {e}")
             self.original_image = None
+            self._cache_key = self._cached_stack = None
             self.tiles = []
             self.tile_size = (0, 0)
             return False
 
     def split_image(self) -> List[np.ndarray]:
-        """Split image into 4x4 grid."""
+        """Split image into a grid_size x grid_size grid.
+
+        The tiles are copied once into ``tile_stack``, a contiguous
+        (n*n + 1, height, width, 3) array whose entry 0 is the white blank
+        and entry ``t`` is tile ``t``; ``tiles`` holds views into it.
+        """
         if self.original_image is None:
             raise ValueError("Image not loaded. Please load an image first.")
         
+        n = self.grid_size
         height, width = self.original_image.shape[:2]
-        if height % 4 != 0 or width % 4 != 0:
-            raise ValueError("Image dimensions must be divisible by 4")
+        if height % n != 0 or width % n != 0:
+            raise ValueError(f"Image dimensions must be divisible by {n}")
 
-        self.tiles = []
-        tile_height, tile_width = self.tile_size[1], self.tile_size[0]
-
-        for i in range(4):
-            for j in range(4):
-                y_start = i * tile_height
-                y_end = (i + 1) * tile_height
-                x_start = j * tile_width
-                x_end = (j + 1) * tile_width
-                
-                tile = self.original_image[y_start:y_end, x_start:x_end].copy()
-                self.tiles.append(tile)
+        tile_width, tile_height = self.tile_size
+        if self._cached_stack is not None:
+            self.tile_stack = self._cached_stack
+        else:
+            self.tile_stack = np.empty((n * n + 1, tile_height, tile_width, 3), dtype=np.uint8)
+            self.tile_stack[0] = 255  # Blank tile is white
+            self.tile_stack[1:].reshape(n, n, tile_height, tile_width, 3)[...] = grid_view(self.original_image, n)
+            if self._cache_key is not None:
+                self.tile_cache.put(self._cache_key, self.tile_stack)
+        self.tiles = list(self.tile_stack[1:])
+        self._merged = None
 
         return self.tiles
 
     def merge_tiles(self, tile_order: List[int]) -> np.ndarray:
-        """Merge tiles based on given order."""
+        """Merge tiles based on given order.
+
+        The result is written into a buffer that is reused by the next call,
+        so copy it if it has to outlive that call.
+        """
         if not self.tiles:
             raise ValueError("No tiles available. Split an image first.")
-        if len(tile_order) != 16:  # Change from 9 to 16
-            raise ValueError("Invalid tile order. Must have exactly 16 positions.")
-        
-        # Create blank merged image
-        height = self.tile_size[1] * 4  # Change from 3 to 4
-        width = self.tile_size[0] * 4  # Change from 3 to 4
-        merged = np.zeros((height, width, 3), dtype=np.uint8)  # Ensure 3 channels for RGB
+        n = self.grid_size
+        if len(tile_order) != n * n:
+            raise ValueError(f"Invalid tile order. Must have exactly {n * n} positions.")
         
-        for i in range(4):  # Change from 3 to 4
-            for j in range(4):  # Change from 3 to 4
-                idx = i * 4 + j  # Change from 3 to 4
-                tile_idx = tile_order[idx]
-                
-                y_start = i * self.tile_size[1]
-                y_end = (i + 1) * self.tile_size[1]
-                x_start = j * self.tile_size[0]
-                x_end = (j + 1) * self.tile_size[0]
-                
-                if tile_idx == 0:  # Blank tile
-                    merged[y_start:y_end, x_start:x_end] = 255  # White
-                else:
-                    merged[y_start:y_end, x_start:x_end] = self.tiles[tile_idx - 1]
-                    
-        return merged
+        if self._merged is None:
+            tile_height, tile_width = self.tile_stack.shape[1:3]
+            self._merged = np.empty((tile_height * n, tile_width * n, 3), dtype=np.uint8)
+        return merge_grid(self.tile_stack, tile_order, self._merged, n)
 
     # def get_tile(self, index: int) -> Optional[np.ndarray]:
     #     """Get tile by index safely."""
@@ -0,0 +1,120 @@
+# src/puzzle/anytime.py
+"""
+Anytime Weighted A*
+-------------------
+Bounded-suboptimal search that finds a first solution quickly by inflating the
+heuristic (f' = g + w * h), then keeps expanding to improve it. Nodes whose
+unweighted f cannot beat the incumbent are pruned, and when the open list runs
+dry the incumbent is proven optimal. If the budget runs out first, the best
+solution is returned together with a proven lower bound: the smallest
+unweighted f on the open list.
+"""
+import heapq
+from dataclasses import dataclass
+from itertools import count
+from typing import Dict, List, Optional, Tuple
+
+from .board import BITS, GOAL, MASK, NEIGHBORS
+from .heuristics import Heuristic, ManhattanHeuristic
+from .limits import SearchLimitExceeded, SearchLimits
+
+
+@dataclass
+class AnytimeResult:
+    moves: List
+    lower_bound: int
+    optimal: bool
+    solutions_found: int
+    nodes_expanded: int
+
+    @property
+    def length(self) -> int:
+        return len(self.moves)
+
+
+class AnytimeSearch:
+    def __init__(self, board: int, blank: int, weight: float = 2.0, heuristic: Optional[Heuristic] = None,
+                 limits: Optional[SearchLimits] = None):
+        if weight < 1:
+            raise ValueError("Weight must be at least 1.")
+        self.board = board
+        self.blank = blank
+        self.weight = weight
+        self.heuristic = heuristic or ManhattanHeuristic()
+        self.limits = limits or SearchLimits()
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.peak_frontier = 0
+
+    def search(self) -> AnytimeResult:
+        """Runs until the incumbent is proven optimal or the budget runs out.
+
+        The returned moves are the cells the blank moves to. Raises
+        SearchLimitExceeded if the budget runs out before any solution is found.
+        """
+        weight, update = self.weight, self.heuristic.update
+        h, context = self.heuristic.initial(self.board)
+        tie = count()
+        # (weighted f, -g, tie, g, h, board, blank, context)
+        frontier = [(weight * h, 0, next(tie), 0, h, self.board, self.blank, context)]
+        best_g: Dict[int, int] = {self.board: 0}
+        parents: Dict[int, Tuple[int, int]] = {}
+        incumbent: Optional[List[int]] = None
+        solutions_found = 0
+        checkpoint = self.limits.start()
+
+        try:
+            while frontier:
+                _, _, _, g, h, board, blank, context = heapq.heappop(frontier)
+                if g > best_g[board] or (incumbent is not None and g + h >= len(incumbent)):
+                    continue
+                if board == GOAL:
+                    incumbent = self._reconstruct(parents, board)
+                    solutions_found += 1
+                    continue
+
+                self.nodes_expanded += 1
+                if self.nodes_expanded >= checkpoint:
+                    checkpoint = self.limits.check(self.nodes_expanded, g + h)
+                if len(frontier) > self.peak_frontier:
+                    self.peak_frontier = len(frontier)
+
+                for target in NEIGHBORS[blank]:
+                    shift = target * BITS
+                    tile = (board >> shift) & MASK
+                    new_board = board ^ (tile << shift) ^ (tile << (blank * BITS))
+                    new_g = g + 1
+                    if new_g >= best_g.get(new_board, new_g + 1):
+                        continue
+                    new_h, new_context = update(context, new_board, tile, target, blank)
+                    if incumbent is not None and new_g + new_h >= len(incumbent):
+                        continue
+                    best_g[new_board] = new_g
+                    self.nodes_generated += 1
+                    parents[new_board] = (board, target)
+                    heapq.heappush(frontier, (new_g + weight * new_h, -new_g, next(tie),
+                                              new_g, new_h, new_board, target, new_context))
+        except SearchLimitExceeded:
+            if incumbent is None:
+                raise
+            # The limit is checked before the popped node's children are pushed,
+            # so that node still counts as open.
+            open_bound = min(
+                (entry[3] + entry[4] for entry in frontier if entry[3] == best_g[entry[5]]),
+                default=g + h,
+            )
+            open_bound = min(open_bound, g + h)
+            lower_bound = min(open_bound, len(incumbent))
+            return AnytimeResult(incumbent, lower_bound, lower_bound == len(incumbent),
+                                 solutions_found, self.nodes_expanded)
+
+        if incumbent is None:
+            raise ValueError("Puzzle is not solvable.")
+        return AnytimeResult(incumbent, len(incumbent), True, solutions_found, self.nodes_expanded)
+
+    def _reconstruct(self, parents: Dict[int, Tuple[int, int]], board: int) -> List[int]:
+        path = []
+        while board != self.board:
+            board, target = parents[board]
+            path.append(target)
+        return path[::-1]
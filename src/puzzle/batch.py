@@ -0,0 +1,123 @@
+# src/puzzle/batch.py
+"""
+Batch Solving
+-------------
+Solves many boards across a process pool and yields results as they finish.
+
+The heuristic is created once in the parent and handed to every worker when
+the pool starts, so lookup tables are built once per process (or inherited
+copy-on-write with fork) and pattern databases are memory-mapped, sharing
+their pages between workers.
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from .board import GOAL, SIZE
+from .heuristics import Heuristic, get_heuristic
+from .limits import SearchLimitExceeded
+from .puzzle_state import PuzzleState
+from .solution import Solution
+from .solver import PuzzleSolver
+from .stats import SearchStats
+
+SOLVED = "solved"
+LIMIT_EXCEEDED = "limit_exceeded"
+UNSOLVABLE = "unsolvable"
+INVALID = "invalid"  # the engine cannot take this board, or the input was malformed
+FAILED = "failed"
+
+
+@dataclass
+class BatchResult:
+    index: int
+    board: int
+    status: str
+    solution: Optional[Solution] = None
+    stats: Optional[SearchStats] = None
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def moves(self) -> Optional[List[Tuple[int, int]]]:
+        return None if self.solution is None else list(self.solution.moves())
+
+    @property
+    def length(self) -> Optional[int]:
+        return None if self.solution is None else len(self.solution)
+
+
+_worker_heuristic: Optional[Heuristic] = None
+
+
+def _init_worker(heuristic: Heuristic) -> None:
+    global _worker_heuristic
+    _worker_heuristic = heuristic
+    # Build lazy tables before the first board arrives.
+    heuristic.evaluate(GOAL)
+
+
+def solve_board(index: int, board: int, size: int = SIZE, engine: str = "ida",
+                heuristic: Union[str, Heuristic] = "manhattan", node_limit: Optional[int] = None,
+                time_limit: Optional[float] = None, memory_limit: Optional[int] = None) -> BatchResult:
+    """Solves one packed board in this process; failures are reported in the result's status."""
+    start_time = time.perf_counter()
+    state = PuzzleState.from_packed(board, size)
+    try:
+        solver = PuzzleSolver(state, engine=engine, heuristic=heuristic, node_limit=node_limit,
+                              time_limit=time_limit, memory_limit=memory_limit)
+    except ValueError as e:  # e.g. an engine that does not take this board size
+        return BatchResult(index, board, INVALID, elapsed=time.perf_counter() - start_time, error=str(e))
+    if not PuzzleState._is_solvable(state.state):
+        return BatchResult(index, board, UNSOLVABLE, stats=solver.stats, elapsed=time.perf_counter() - start_time)
+
+    error = None
+    try:
+        # Results travel back to the parent in the compact form.
+        solution = solver.get_solution()
+        status = SOLVED if solution is not None else FAILED
+    except SearchLimitExceeded:
+        solution, status = None, LIMIT_EXCEEDED
+    except ValueError as e:
+        solution, status, error = None, FAILED, str(e)
+    return BatchResult(index, board, status, solution, solver.stats, time.perf_counter() - start_time, error)
+
+
+def _solve_one(index: int, board: int, size: int, engine: str, node_limit: Optional[int],
+               time_limit: Optional[float], memory_limit: Optional[int]) -> BatchResult:
+    return solve_board(index, board, size, engine, _worker_heuristic, node_limit, time_limit, memory_limit)
+
+
+def solve_many(boards: Iterable[Union[PuzzleState, int]], engine: str = "ida",
+               heuristic: Union[str, Heuristic] = "manhattan", workers: Optional[int] = None,
+               node_limit: Optional[int] = None, time_limit: Optional[float] = None,
+               memory_limit: Optional[int] = None) -> Iterator[BatchResult]:
+    """Solves boards in a process pool, yielding results in completion order.
+
+    Boards may be PuzzleState objects (of any size the engine supports) or
+    packed 4x4 integers. Each result carries
+    the index of its board in the input. Only a bounded number of boards is in
+    flight at a time, so the input may be a lazy iterable of any length.
+    """
+    heuristic = get_heuristic(heuristic)
+    heuristic.evaluate(GOAL)
+    workers = workers or os.cpu_count() or 1
+    packed = (
+        (index, board.to_packed(), board.size) if isinstance(board, PuzzleState) else (index, board, SIZE)
+        for index, board in enumerate(boards)
+    )
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(heuristic,)) as pool:
+        def submit(batch):
+            return {pool.submit(_solve_one, index, board, size, engine, node_limit, time_limit, memory_limit)
+                    for index, board, size in batch}
+
+        pending = submit(islice(packed, workers * 4))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending |= submit(islice(packed, len(done)))
+            for future in done:
+                yield future.result()
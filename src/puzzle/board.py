@@ -0,0 +1,98 @@
+# src/puzzle/board.py
+"""
+Packed Board Encoding
+---------------------
+Compact representation of a 4x4 board as a single integer. Cell ``i`` (row-major)
+occupies bits ``4*i .. 4*i+3`` and holds the tile number, with 0 for the blank.
+Neighbor tables are precomputed per blank index so the solver can expand a
+state with a couple of integer operations instead of copying lists.
+
+Larger boards pack the same way with wider fields (see ``bits_for``); the
+optional ``bits`` and ``cells`` arguments select the field width and board size.
+"""
+from typing import Iterable, List, Tuple
+
+SIZE = 4
+CELLS = SIZE * SIZE
+BITS = 4
+MASK = (1 << BITS) - 1
+
+
+def bits_for(size: int) -> int:
+    """Field width needed to pack a board of the given side length."""
+    return max(BITS, (size * size - 1).bit_length())
+
+
+def pack(tiles: Iterable[int], bits: int = BITS) -> int:
+    """Packs a flat, row-major sequence of tiles into an integer."""
+    board = 0
+    for index, tile in enumerate(tiles):
+        board |= tile << (index * bits)
+    return board
+
+
+def unpack(board: int, cells: int = CELLS, bits: int = BITS) -> List[int]:
+    """Unpacks an integer board into a flat, row-major list of tiles."""
+    mask = (1 << bits) - 1
+    return [(board >> (index * bits)) & mask for index in range(cells)]
+
+
+def tile_at(board: int, index: int, bits: int = BITS) -> int:
+    """Returns the tile stored at the given cell index."""
+    return (board >> (index * bits)) & ((1 << bits) - 1)
+
+
+def find_blank(board: int, cells: int = CELLS, bits: int = BITS) -> int:
+    """Returns the cell index of the blank tile."""
+    mask = (1 << bits) - 1
+    for index in range(cells):
+        if not (board >> (index * bits)) & mask:
+            return index
+    raise ValueError("Invalid puzzle state: no blank tile found")
+
+
+def slide(board: int, blank: int, target: int, bits: int = BITS) -> int:
+    """Moves the blank from ``blank`` to the adjacent cell ``target``.
+
+    The blank field is zero, so XOR-ing the tile out of ``target`` and into
+    ``blank`` swaps the two cells without any masking.
+    """
+    tile = (board >> (target * bits)) & ((1 << bits) - 1)
+    return board ^ (tile << (target * bits)) ^ (tile << (blank * bits))
+
+
+def build_neighbors(size: int = SIZE) -> Tuple[Tuple[int, ...], ...]:
+    """Neighbor cells of every cell on a size x size board."""
+    neighbors = []
+    for index in range(size * size):
+        row, col = divmod(index, size)
+        cells = []
+        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # right, down, left, up
+            new_row, new_col = row + dr, col + dc
+            if 0 <= new_row < size and 0 <= new_col < size:
+                cells.append(new_row * size + new_col)
+        neighbors.append(tuple(cells))
+    return tuple(neighbors)
+
+
+def _build_manhattan() -> Tuple[Tuple[int, ...], ...]:
+    table = [[0] * CELLS for _ in range(CELLS)]
+    for tile in range(1, CELLS):
+        goal_row, goal_col = divmod(tile - 1, SIZE)
+        for index in range(CELLS):
+            row, col = divmod(index, SIZE)
+            table[tile][index] = abs(goal_row - row) + abs(goal_col - col)
+    return tuple(tuple(row) for row in table)
+
+
+GOAL = pack(list(range(1, CELLS)) + [0])
+GOAL_BLANK = CELLS - 1
+
+# NEIGHBORS[blank] lists the cells the blank can move to.
+NEIGHBORS = build_neighbors()
+
+# POSITIONS[index] is the (row, col) of a cell index, matching PuzzleState moves.
+POSITIONS = tuple(divmod(index, SIZE) for index in range(CELLS))
+
+# MANHATTAN[tile][index] is the distance of ``tile`` at cell ``index`` from its goal cell.
+MANHATTAN = _build_manhattan()
@@ -0,0 +1,154 @@
+# src/puzzle/cache.py
+"""
+Solution Cache
+--------------
+Two-tier cache of optimal solutions: an in-memory LRU in front of a local
+sqlite file. Every board on a stored solution path gets its own entry holding
+the blank's next cell and the remaining distance, so any board that lies on a
+previously solved path is a hit, and a full solution is replayed by following
+the entries to the goal.
+
+Keys are canonicalized under reflection in the main diagonal. The goal (blank
+in the corner) is symmetric under that reflection, so a board and its mirror
+image share one entry; moves are mirrored back on the way out.
+"""
+import os
+import sqlite3
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+from .board import BITS, CELLS, GOAL, MASK, SIZE, find_blank, slide
+
+
+def _build_reflection() -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    cells, tiles = [0] * CELLS, [0] * CELLS
+    for index in range(CELLS):
+        row, col = divmod(index, SIZE)
+        cells[index] = col * SIZE + row
+    for tile in range(1, CELLS):
+        tiles[tile] = cells[tile - 1] + 1
+    return tuple(cells), tuple(tiles)
+
+
+# REFLECTED_CELLS[index] is the mirror cell; REFLECTED_TILES[tile] is the tile whose goal is mirrored.
+REFLECTED_CELLS, REFLECTED_TILES = _build_reflection()
+
+
+def reflect(board: int) -> int:
+    """Reflects a packed board in the main diagonal, relabelling tiles to match."""
+    reflected = 0
+    for index in range(CELLS):
+        reflected |= REFLECTED_TILES[(board >> (index * BITS)) & MASK] << (REFLECTED_CELLS[index] * BITS)
+    return reflected
+
+
+def canonical(board: int) -> Tuple[int, bool]:
+    """Returns the canonical key of a board and whether it was reflected."""
+    mirrored = reflect(board)
+    return (mirrored, True) if mirrored < board else (board, False)
+
+
+def _to_sql(key: int) -> int:
+    # sqlite integers are signed 64-bit.
+    return key - (1 << 64) if key >= 1 << 63 else key
+
+
+class SolutionCache:
+    """Maps boards to optimal solutions (as cells the blank moves to)."""
+
+    def __init__(self, path: Optional[os.PathLike] = None, max_entries: int = 100_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.memory: "OrderedDict[int, Tuple[int, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        if self._connection is None and self.path is not None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS solutions "
+                "(board INTEGER PRIMARY KEY, next_cell INTEGER NOT NULL, distance INTEGER NOT NULL)"
+            )
+        return self._connection
+
+    def _remember(self, key: int, entry: Tuple[int, int]) -> None:
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def _lookup(self, key: int) -> Optional[Tuple[int, int]]:
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory.move_to_end(key)
+            return entry
+        if self.connection is None:
+            return None
+        row = self.connection.execute(
+            "SELECT next_cell, distance FROM solutions WHERE board = ?", (_to_sql(key),)
+        ).fetchone()
+        if row is None:
+            return None
+        entry = (row[0], row[1])
+        self._remember(key, entry)
+        return entry
+
+    def get(self, board: int) -> Optional[List[int]]:
+        """Returns the cached solution for a packed board, or None on a miss."""
+        moves: List[int] = []
+        blank = find_blank(board)
+        expected = None
+        while board != GOAL:
+            key, reflected = canonical(board)
+            entry = self._lookup(key)
+            # Distances must count down by one, or the entries came from different paths.
+            if entry is None or (expected is not None and entry[1] != expected):
+                self.misses += 1
+                return None
+            next_cell, distance = entry
+            target = REFLECTED_CELLS[next_cell] if reflected else next_cell
+            moves.append(target)
+            board, blank = slide(board, blank, target), target
+            expected = distance - 1
+        self.hits += 1
+        return moves
+
+    def step(self, board: int) -> Optional[Tuple[int, int]]:
+        """Returns ``(next cell, distance)`` for a board on a cached path, or None."""
+        key, reflected = canonical(board)
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        next_cell, distance = entry
+        return (REFLECTED_CELLS[next_cell] if reflected else next_cell), distance
+
+    def put(self, board: int, moves: Sequence[int]) -> None:
+        """Stores an optimal solution, with an entry for every board on its path."""
+        rows = []
+        blank = find_blank(board)
+        for step, target in enumerate(moves):
+            key, reflected = canonical(board)
+            next_cell = REFLECTED_CELLS[target] if reflected else target
+            entry = (next_cell, len(moves) - step)
+            self._remember(key, entry)
+            rows.append((_to_sql(key), *entry))
+            board, blank = slide(board, blank, target), target
+        if self.connection is not None and rows:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO solutions (board, next_cell, distance) VALUES (?, ?, ?)", rows
+                )
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __getstate__(self) -> dict:
+        # sqlite connections cannot cross processes; each process reconnects lazily.
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
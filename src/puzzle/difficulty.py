@@ -0,0 +1,159 @@
+# src/puzzle/difficulty.py
+"""
+Difficulty Estimation
+---------------------
+Estimates how hard 4x4 boards are without searching, so that callers can
+route them (hard boards to big workers, easy ones inline) or order a batch.
+
+Each estimate has an admissible lower bound on the solution length
+(Manhattan distance plus linear conflicts, as in heuristics.py) and a
+predicted IDA* node count and solve time. The prediction is a small
+log-linear model of the two heuristic terms, fitted on benchmark results:
+
+    ln(nodes) = intercept + per_move * distance + per_conflict * conflicts
+
+The spread is wide (roughly a factor of ten either way), which is enough to
+tell a 1 ms board from a 10 s one. Refit it on your own hardware and engine
+with ``DifficultyModel.from_report`` and a report from src/benchmark.py.
+
+Everything is vectorized over a (count, 16) uint8 array of boards, as made by
+generator.py; a million boards take well under a second.
+"""
+from dataclasses import dataclass
+from math import erfc
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from .board import CELLS, SIZE
+from .generator import manhattan, unpack_boards
+from .heuristics import COL_CODES, LINE_CONFLICTS, ROW_CODES
+from .puzzle_state import PuzzleState
+
+_ROW_CODES = np.array(ROW_CODES, dtype=np.int32)
+_COL_CODES = np.array(COL_CODES, dtype=np.int32)
+_LINE_CONFLICTS = np.array(LINE_CONFLICTS, dtype=np.int32)
+_normal_tail = np.vectorize(lambda z: 0.5 * erfc(z / np.sqrt(2)))  # P(Z > z)
+
+
+@dataclass
+class Estimate:
+    lower_bound: int  # no solution is shorter
+    nodes: float  # predicted IDA* expansions
+    seconds: float  # predicted solve time
+
+
+@dataclass
+class DifficultyModel:
+    intercept: float
+    per_move: float  # ln(nodes) per move of Manhattan distance
+    per_conflict: float  # ln(nodes) per move of linear conflicts
+    nodes_per_second: float
+
+    def predict(self, distance: np.ndarray, conflicts: np.ndarray) -> np.ndarray:
+        """Predicted node counts for the given heuristic terms."""
+        return np.exp(self.intercept + self.per_move * distance + self.per_conflict * conflicts)
+
+    @classmethod
+    def fit(cls, boards: np.ndarray, nodes: np.ndarray, seconds: np.ndarray,
+            censored: Optional[np.ndarray] = None, iterations: int = 200) -> "DifficultyModel":
+        """Fits the model to boards and the nodes and seconds their searches took.
+
+        ``censored`` marks boards whose search was cut off by a limit: their
+        node count is only a lower bound. They are fitted as such (a Tobit
+        model, by expectation-maximization), so hard boards that hit the limit
+        pull the prediction up rather than down. Without censored boards this
+        is ordinary least squares on ln(nodes).
+        """
+        distance, conflicts = heuristic_terms(boards)
+        features = np.column_stack([np.ones(len(distance)), distance, conflicts])
+        nodes = np.asarray(nodes, dtype=float)
+        log_nodes = np.log(np.maximum(nodes, 1))
+        censored = np.zeros(len(nodes), dtype=bool) if censored is None else np.asarray(censored, dtype=bool)
+
+        coefficients = np.linalg.lstsq(features[~censored], log_nodes[~censored], rcond=None)[0]
+        sigma = max(float(np.std(log_nodes[~censored] - features[~censored] @ coefficients)), 0.1)
+        for _ in range(iterations if censored.any() else 0):
+            # E-step: the expected log count of a censored board, given that it exceeds its cut-off.
+            mean = features @ coefficients
+            z = (log_nodes - mean) / sigma
+            tail = np.maximum(_normal_tail(z).astype(float), 1e-300)
+            ratio = np.exp(-0.5 * z * z) / np.sqrt(2 * np.pi) / tail
+            expected = np.where(censored, mean + sigma * ratio, log_nodes)
+            variance = np.where(censored, sigma * sigma * (1 + z * ratio - ratio * ratio), 0.0)
+            # M-step
+            coefficients = np.linalg.lstsq(features, expected, rcond=None)[0]
+            sigma = float(np.sqrt(np.mean((expected - features @ coefficients) ** 2 + variance)))
+
+        total_seconds = float(np.sum(seconds))
+        nodes_per_second = float(np.sum(nodes)) / total_seconds if total_seconds > 0 else 1e6
+        return cls(*(float(value) for value in coefficients), nodes_per_second)
+
+    @classmethod
+    def from_report(cls, report: dict) -> "DifficultyModel":
+        """Fits a src/benchmark.py report; boards that hit the node limit count as censored."""
+        results = [result for result in report["results"] if result["status"] in ("solved", "limit_exceeded")]
+        if sum(result["status"] == "solved" for result in results) < 3:
+            raise ValueError("Need at least three solved boards to fit a model")
+        packed = np.array([int(result["board"], 16) for result in results], dtype=np.uint64)
+        return cls.fit(unpack_boards(packed), np.array([result["nodes_expanded"] for result in results]),
+                       np.array([result["elapsed"] for result in results]),
+                       np.array([result["status"] == "limit_exceeded" for result in results]))
+
+
+# Fitted with DifficultyModel.from_report on 150 seeded random walks of 10-130
+# moves per heuristic with the IDA* engine (src/benchmark.py), node limits of
+# 3M (manhattan) and 800k (linear_conflict).
+MODELS: Dict[str, DifficultyModel] = {
+    "manhattan": DifficultyModel(-0.094, 0.396, 0.885, 705_000.0),
+    "linear_conflict": DifficultyModel(0.19, 0.348, 0.578, 117_000.0),
+}
+
+
+def _as_tiles(boards: np.ndarray) -> np.ndarray:
+    boards = np.asarray(boards)
+    if boards.ndim == 1:  # packed uint64 boards
+        boards = unpack_boards(boards.astype(np.uint64))
+    if boards.shape[1] != CELLS:
+        raise ValueError(f"Difficulty estimates are for {SIZE}x{SIZE} boards only")
+    return boards
+
+
+def heuristic_terms(boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Manhattan distance and linear-conflict moves of every board.
+
+    ``boards`` is a (count, 16) array of tiles or a 1-D array of packed boards.
+    """
+    boards = _as_tiles(boards).astype(np.intp)
+    cells = np.arange(CELLS)
+    row_codes = _ROW_CODES[boards, cells].reshape(-1, SIZE, SIZE).sum(axis=2)
+    col_codes = _COL_CODES[boards, cells].reshape(-1, SIZE, SIZE).sum(axis=1)
+    conflicts = _LINE_CONFLICTS[row_codes].sum(axis=1) + _LINE_CONFLICTS[col_codes].sum(axis=1)
+    return manhattan(boards).astype(np.int64), conflicts.astype(np.int64)
+
+
+def estimate_many(boards: np.ndarray, heuristic: str = "manhattan",
+                  model: Optional[DifficultyModel] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns arrays of lower bounds, predicted nodes and predicted seconds.
+
+    The prediction is for the IDA* engine with ``heuristic``, unless another
+    ``model`` is given.
+    """
+    if model is None:
+        if heuristic not in MODELS:
+            raise ValueError(f"No difficulty model for '{heuristic}'; fit one with DifficultyModel.from_report")
+        model = MODELS[heuristic]
+    distance, conflicts = heuristic_terms(boards)
+    nodes = model.predict(distance, conflicts)
+    return distance + conflicts, nodes, nodes / model.nodes_per_second
+
+
+def estimate(board: Union[PuzzleState, int], heuristic: str = "manhattan",
+             model: Optional[DifficultyModel] = None) -> Estimate:
+    """Estimate for a single board (a PuzzleState or a packed 4x4 board)."""
+    if isinstance(board, PuzzleState):
+        if board.size != SIZE:
+            raise ValueError(f"Difficulty estimates are for {SIZE}x{SIZE} boards only")
+        board = board.to_packed()
+    lower_bounds, nodes, seconds = estimate_many(np.array([board], dtype=np.uint64), heuristic, model)
+    return Estimate(int(lower_bounds[0]), float(nodes[0]), float(seconds[0]))
@@ -0,0 +1,188 @@
+# src/puzzle/generator.py
+"""
+Bulk Board Generation
+---------------------
+Vectorized generation of solvable boards, millions per call. Boards are rows
+of a uint8 array (one tile per cell, row-major, 0 for the blank), which can
+be written straight to a .npy file or packed to one uint64 per 4x4 board.
+
+Uniform boards need no rejection sampling: a random permutation is solvable
+or not depending on its inversion parity, and swapping two non-blank tiles
+flips that parity without moving the blank. Applying the swap to the
+unsolvable half maps it one-to-one onto the solvable half, so the result is
+still uniform over solvable boards.
+
+Difficulty can be targeted by scramble depth (non-backtracking random walks
+from the goal) and/or by a range of the Manhattan lower bound.
+
+Generate a dataset with:
+    python -m src.puzzle.generator --count 1000000 --depth 40:60 --output boards.npy
+"""
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .board import SIZE, build_neighbors
+
+CHUNK = 1 << 18  # boards per vectorized batch, bounds temporary memory
+Range = Union[int, Tuple[int, int]]
+
+
+def _as_range(value: Range) -> Tuple[int, int]:
+    return (value, value) if isinstance(value, int) else (int(value[0]), int(value[1]))
+
+
+def goal_tiles(size: int = SIZE) -> np.ndarray:
+    return np.append(np.arange(1, size * size, dtype=np.uint8), np.uint8(0))
+
+
+def manhattan_table(size: int = SIZE) -> np.ndarray:
+    """table[tile, cell] is the distance of tile at cell from its goal cell (0 for the blank)."""
+    cells = size * size
+    rows, cols = np.divmod(np.arange(cells), size)
+    goal_rows, goal_cols = np.divmod(np.arange(-1, cells - 1), size)
+    table = np.abs(goal_rows[:, None] - rows[None, :]) + np.abs(goal_cols[:, None] - cols[None, :])
+    table[0] = 0
+    return table.astype(np.uint16)
+
+
+def manhattan(boards: np.ndarray, size: int = SIZE) -> np.ndarray:
+    """Manhattan lower bound of every board."""
+    return manhattan_table(size)[boards, np.arange(size * size)].sum(axis=1)
+
+
+def is_solvable(boards: np.ndarray, size: int = SIZE) -> np.ndarray:
+    """Vectorized version of PuzzleState._is_solvable."""
+    parity = np.zeros(len(boards), dtype=np.int64)
+    for i in range(size * size - 1):
+        rest = boards[:, i + 1:]
+        parity += ((boards[:, i:i + 1] > rest) & (rest != 0)).sum(axis=1)
+    if size % 2 == 0:
+        parity += size - 1 - np.argmin(boards, axis=1) // size
+    return parity % 2 == 0
+
+
+def uniform_boards(count: int, size: int = SIZE, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Uniformly random solvable boards."""
+    rng = rng or np.random.default_rng()
+    boards = rng.permuted(np.tile(goal_tiles(size), (count, 1)), axis=1)
+    rows = np.flatnonzero(~is_solvable(boards, size))
+    blank = np.argmin(boards[rows], axis=1)
+    first = (blank == 0).astype(np.intp)  # cells 0/1, or 1/2 when the blank is in cell 0,
+    second = 1 + (blank <= 1)             # or 0/2 when it is in cell 1
+    boards[rows, first], boards[rows, second] = boards[rows, second], boards[rows, first]
+    return boards
+
+
+def scrambled_boards(count: int, depth: Range, size: int = SIZE,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Random walks from the goal that never undo a move, ``depth`` moves long.
+
+    ``depth`` is a number of moves or an inclusive ``(low, high)`` range drawn
+    per board.
+    """
+    rng = rng or np.random.default_rng()
+    low, high = _as_range(depth)
+    neighbors = np.full((size * size, 4), -1, dtype=np.intp)
+    for cell, cells in enumerate(build_neighbors(size)):
+        neighbors[cell, :len(cells)] = cells
+
+    boards = np.tile(goal_tiles(size), (count, 1))
+    rows = np.arange(count)
+    depths = rng.integers(low, high + 1, size=count)
+    blank = np.full(count, size * size - 1, dtype=np.intp)
+    previous = np.full(count, -1, dtype=np.intp)
+    for step in range(high):
+        candidates = neighbors[blank]
+        keys = rng.random(candidates.shape)
+        keys[(candidates < 0) | (candidates == previous[:, None])] = -1
+        target = candidates[rows, keys.argmax(axis=1)]
+        target = np.where(step < depths, target, blank)  # finished walks stay put
+        boards[rows, blank] = boards[rows, target]
+        boards[rows, target] = 0
+        previous = np.where(step < depths, blank, previous)
+        blank = target
+    return boards
+
+
+def generate_boards(count: int, size: int = SIZE, depth: Optional[Range] = None,
+                    lower_bound: Optional[Range] = None, seed: Optional[int] = None) -> np.ndarray:
+    """Returns a (count, size * size) uint8 array of solvable boards.
+
+    Boards are uniformly random, or scrambled ``depth`` moves from the goal.
+    With ``lower_bound`` only boards whose Manhattan distance falls in the
+    inclusive range are kept.
+    """
+    rng = np.random.default_rng(seed)
+    output = np.empty((count, size * size), dtype=np.uint8)
+    filled = empty_chunks = 0
+    while filled < count:
+        chunk = min(CHUNK, count - filled) if lower_bound is None else CHUNK
+        if depth is None:
+            boards = uniform_boards(chunk, size, rng)
+        else:
+            boards = scrambled_boards(chunk, depth, size, rng)
+        if lower_bound is not None:
+            low, high = _as_range(lower_bound)
+            distance = manhattan(boards, size)
+            boards = boards[(distance >= low) & (distance <= high)]
+            empty_chunks = 0 if len(boards) else empty_chunks + 1
+            if empty_chunks >= 100:
+                raise ValueError(f"No boards found with a lower bound in {lower_bound}")
+        taken = min(len(boards), count - filled)
+        output[filled:filled + taken] = boards[:taken]
+        filled += taken
+    return output
+
+
+def pack_boards(boards: np.ndarray) -> np.ndarray:
+    """Packs 4x4 boards into uint64 values with the layout of board.pack."""
+    if boards.shape[1] != 16:
+        raise ValueError("Only 4x4 boards fit in 64 bits")
+    shifts = np.arange(0, 64, 4, dtype=np.uint64)
+    return np.bitwise_or.reduce(boards.astype(np.uint64) << shifts, axis=1)
+
+
+def unpack_boards(packed: np.ndarray) -> np.ndarray:
+    shifts = np.arange(0, 64, 4, dtype=np.uint64)
+    return ((packed[:, None] >> shifts) & np.uint64(15)).astype(np.uint8)
+
+
+def write_boards(path: Union[str, Path], boards: np.ndarray) -> None:
+    """Writes boards as a .npy array, or as text with one board per line."""
+    path = Path(path)
+    if path.suffix == ".npy":
+        np.save(path, boards)
+    else:
+        np.savetxt(path, boards, fmt="%d")
+
+
+def _parse_range(text: str) -> Tuple[int, int]:
+    low, _, high = text.partition(":")
+    return int(low), int(high or low)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate solvable sliding-puzzle boards in bulk.")
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--size", type=int, default=SIZE)
+    parser.add_argument("--depth", type=_parse_range, help="scramble depth N or LOW:HIGH")
+    parser.add_argument("--bound", type=_parse_range, help="Manhattan lower bound N or LOW:HIGH")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", type=Path, required=True, help=".npy for a uint8 array, else text")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    start_time = time.time()
+    boards = generate_boards(args.count, args.size, args.depth, args.bound, args.seed)
+    logging.info(f"Generated {len(boards)} boards in {time.time() - start_time:.2f} seconds")
+    write_boards(args.output, boards)
+    logging.info(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
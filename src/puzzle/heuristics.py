@@ -0,0 +1,270 @@
+# src/puzzle/heuristics.py
+"""
+Heuristics
+----------
+Admissible heuristics for the 15-puzzle behind a common interface, so the
+solver engines can trade heuristic cost against node expansions.
+
+Every heuristic works on packed boards (see board.py) and supports
+incremental evaluation: ``initial`` returns the value for a board together
+with an opaque context, and ``update`` derives the value of a child board from
+the parent's context and the single tile that moved.
+"""
+from collections import deque
+from typing import Any, Dict, List, Tuple, Union
+
+from .board import BITS, CELLS, MANHATTAN, MASK, SIZE
+
+
+class Heuristic:
+    """Base class for heuristics on packed boards."""
+
+    name = ""
+
+    def evaluate(self, board: int) -> int:
+        """Returns the heuristic value of a packed board."""
+        raise NotImplementedError
+
+    def initial(self, board: int) -> Tuple[int, Any]:
+        """Returns ``(h, context)`` for the root of a search."""
+        h = self.evaluate(board)
+        return h, h
+
+    def update(self, context: Any, board: int, tile: int, source: int, destination: int) -> Tuple[int, Any]:
+        """Returns ``(h, context)`` after ``tile`` slid from ``source`` to ``destination``.
+
+        ``board`` is the board after the move and ``context`` the parent's
+        context. Subclasses override this with a delta computation.
+        """
+        h = self.evaluate(board)
+        return h, h
+
+    def __call__(self, board: int) -> int:
+        return self.evaluate(board)
+
+
+class ManhattanHeuristic(Heuristic):
+    """Sum of the Manhattan distances of all tiles."""
+
+    name = "manhattan"
+
+    def evaluate(self, board: int) -> int:
+        distance = 0
+        for index in range(CELLS):
+            distance += MANHATTAN[board & MASK][index]
+            board >>= BITS
+        return distance
+
+    def update(self, context: int, board: int, tile: int, source: int, destination: int) -> Tuple[int, int]:
+        h = context + MANHATTAN[tile][destination] - MANHATTAN[tile][source]
+        return h, h
+
+
+def _build_line_conflicts() -> List[int]:
+    """Extra moves forced by conflicts within one line, keyed by a base-5 line code.
+
+    Digit ``j`` of the code is 0 when the tile in cell ``j`` of the line does not
+    belong to this line, otherwise its goal offset within the line plus one.
+    Tiles that are not part of the longest increasing run must leave the line
+    and come back, which costs two extra moves each.
+    """
+    table = []
+    for code in range(5 ** SIZE):
+        digits = []
+        for _ in range(SIZE):
+            code, digit = divmod(code, 5)
+            if digit:
+                digits.append(digit)
+        longest = [1] * len(digits)
+        for i in range(len(digits)):
+            for j in range(i):
+                if digits[j] < digits[i]:
+                    longest[i] = max(longest[i], longest[j] + 1)
+        table.append(2 * (len(digits) - max(longest, default=0)))
+    return table
+
+
+def _build_line_codes(by_row: bool) -> List[List[int]]:
+    """CODES[tile][index] is the tile's contribution to the code of its row (or column)."""
+    codes = [[0] * CELLS for _ in range(CELLS)]
+    for tile in range(1, CELLS):
+        goal_row, goal_col = divmod(tile - 1, SIZE)
+        for index in range(CELLS):
+            row, col = divmod(index, SIZE)
+            if by_row and row == goal_row:
+                codes[tile][index] = (goal_col + 1) * 5 ** col
+            elif not by_row and col == goal_col:
+                codes[tile][index] = (goal_row + 1) * 5 ** row
+    return codes
+
+
+LINE_CONFLICTS = _build_line_conflicts()
+ROW_CODES = _build_line_codes(by_row=True)
+COL_CODES = _build_line_codes(by_row=False)
+
+
+class LinearConflictHeuristic(Heuristic):
+    """Manhattan distance plus two moves per tile that must leave its line."""
+
+    name = "linear_conflict"
+
+    @staticmethod
+    def _row_conflicts(board: int, row: int) -> int:
+        code = 0
+        for index in range(row * SIZE, row * SIZE + SIZE):
+            code += ROW_CODES[(board >> (index * BITS)) & MASK][index]
+        return LINE_CONFLICTS[code]
+
+    @staticmethod
+    def _col_conflicts(board: int, col: int) -> int:
+        code = 0
+        for index in range(col, CELLS, SIZE):
+            code += COL_CODES[(board >> (index * BITS)) & MASK][index]
+        return LINE_CONFLICTS[code]
+
+    def initial(self, board: int) -> Tuple[int, Tuple[int, int]]:
+        distance = ManhattanHeuristic().evaluate(board)
+        conflicts = 0
+        for line in range(SIZE):
+            conflicts += self._row_conflicts(board, line) + self._col_conflicts(board, line)
+        return distance + conflicts, (distance, conflicts)
+
+    def evaluate(self, board: int) -> int:
+        return self.initial(board)[0]
+
+    def update(self, context: Tuple[int, int], board: int, tile: int, source: int,
+               destination: int) -> Tuple[int, Tuple[int, int]]:
+        distance, conflicts = context
+        distance += MANHATTAN[tile][destination] - MANHATTAN[tile][source]
+        parent = board ^ (tile << (destination * BITS)) ^ (tile << (source * BITS))
+
+        # Only the lines through the two cells can change.
+        source_row, source_col = divmod(source, SIZE)
+        destination_row, destination_col = divmod(destination, SIZE)
+        rows = {source_row, destination_row}
+        cols = {source_col, destination_col}
+        for row in rows:
+            conflicts += self._row_conflicts(board, row) - self._row_conflicts(parent, row)
+        for col in cols:
+            conflicts += self._col_conflicts(board, col) - self._col_conflicts(parent, col)
+        return distance + conflicts, (distance, conflicts)
+
+
+_BLANK_SHIFT = 3 * CELLS
+
+
+def _build_walking_distance() -> Dict[int, int]:
+    """Breadth-first search over row-occupancy tables from the goal.
+
+    A state records, for every row, how many tiles it holds from each goal row,
+    plus the row of the blank. Counts use 3 bits each and the blank row sits
+    above them. Moving a tile vertically moves one count between adjacent rows.
+    """
+    goal = [[SIZE if row == group else 0 for group in range(SIZE)] for row in range(SIZE)]
+    goal[SIZE - 1][SIZE - 1] -= 1
+
+    def encode(counts: List[List[int]], blank_row: int) -> int:
+        key = blank_row << _BLANK_SHIFT
+        for row in range(SIZE):
+            for group in range(SIZE):
+                key |= counts[row][group] << (3 * (row * SIZE + group))
+        return key
+
+    table = {encode(goal, SIZE - 1): 0}
+    queue = deque([(goal, SIZE - 1, 0)])
+    while queue:
+        counts, blank_row, depth = queue.popleft()
+        for row in (blank_row - 1, blank_row + 1):
+            if not 0 <= row < SIZE:
+                continue
+            for group in range(SIZE):
+                if not counts[row][group]:
+                    continue
+                moved = [list(line) for line in counts]
+                moved[row][group] -= 1
+                moved[blank_row][group] += 1
+                key = encode(moved, row)
+                if key not in table:
+                    table[key] = depth + 1
+                    queue.append((moved, row, depth + 1))
+    return table
+
+
+def _build_walking_units(by_row: bool) -> List[List[int]]:
+    """UNITS[tile][index] is the tile's contribution to the walking-distance key.
+
+    Tile 0 contributes the blank's line, so a key is just a sum over cells.
+    """
+    units = [[0] * CELLS for _ in range(CELLS)]
+    for index in range(CELLS):
+        row, col = divmod(index, SIZE)
+        line = row if by_row else col
+        units[0][index] = line << _BLANK_SHIFT
+        for tile in range(1, CELLS):
+            goal_row, goal_col = divmod(tile - 1, SIZE)
+            group = goal_row if by_row else goal_col
+            units[tile][index] = 1 << (3 * (line * SIZE + group))
+    return units
+
+
+class WalkingDistanceHeuristic(Heuristic):
+    """Walking distance: vertical plus horizontal moves of the relaxed row/column problems.
+
+    The goal is symmetric under transposition, so one table serves both axes.
+    """
+
+    name = "walking_distance"
+    _table: Dict[int, int] = {}
+    _row_units: List[List[int]] = []
+    _col_units: List[List[int]] = []
+
+    def __init__(self):
+        cls = type(self)
+        if not cls._table:
+            cls._table = _build_walking_distance()
+            cls._row_units = _build_walking_units(by_row=True)
+            cls._col_units = _build_walking_units(by_row=False)
+
+    def __reduce__(self):
+        # The tables live on the class, which a spawned process imports empty;
+        # rebuilding through __init__ fills them there too.
+        return type(self), ()
+
+    def initial(self, board: int) -> Tuple[int, Tuple[int, int]]:
+        row_key = col_key = 0
+        for index in range(CELLS):
+            tile = (board >> (index * BITS)) & MASK
+            row_key += self._row_units[tile][index]
+            col_key += self._col_units[tile][index]
+        return self._table[row_key] + self._table[col_key], (row_key, col_key)
+
+    def evaluate(self, board: int) -> int:
+        return self.initial(board)[0]
+
+    def update(self, context: Tuple[int, int], board: int, tile: int, source: int,
+               destination: int) -> Tuple[int, Tuple[int, int]]:
+        row_key, col_key = context
+        rows, cols = self._row_units, self._col_units
+        row_key += rows[tile][destination] - rows[tile][source] + rows[0][source] - rows[0][destination]
+        col_key += cols[tile][destination] - cols[tile][source] + cols[0][source] - cols[0][destination]
+        return self._table[row_key] + self._table[col_key], (row_key, col_key)
+
+
+HEURISTICS = ("manhattan", "linear_conflict", "walking_distance", "pdb")
+
+
+def get_heuristic(heuristic: Union[str, Heuristic]) -> Heuristic:
+    """Returns a heuristic instance for a name (or passes an instance through)."""
+    if isinstance(heuristic, Heuristic):
+        return heuristic
+    if heuristic == "manhattan":
+        return ManhattanHeuristic()
+    if heuristic == "linear_conflict":
+        return LinearConflictHeuristic()
+    if heuristic == "walking_distance":
+        return WalkingDistanceHeuristic()
+    if heuristic == "pdb":
+        # Imported here so numpy is only loaded when pattern databases are used.
+        from .pattern_database import PatternDatabase
+        return PatternDatabase()
+    raise ValueError(f"Unknown heuristic '{heuristic}'. Expected one of {HEURISTICS}.")
@@ -0,0 +1,101 @@
+# src/puzzle/hints.py
+"""
+Hints
+-----
+Optimal next moves for manual play. Every plan found is stored in a
+SolutionCache, which keeps the next move and remaining distance of every
+board on its path, so a player who follows the plan gets each hint from a
+dictionary lookup.
+
+A player who leaves the plan is usually one move away from it. Neighboring
+boards differ in distance by exactly one, so a board next to a planned board
+at distance d is at distance d - 1 or d + 1: one IDA* iteration with bound
+d - 1 either finds the shortcut or proves that going back is optimal. Only
+boards with no planned neighbor need a full search, which starts from the
+best lower bound learned for them so far, so a search cut short by a time
+limit resumes where it stopped.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+
+from .board import GOAL, NEIGHBORS, POSITIONS, find_blank, slide
+from .cache import SolutionCache
+from .heuristics import Heuristic, get_heuristic
+from .ida_star import FOUND, IDAStarSearch
+from .limits import SearchLimitExceeded, SearchLimits
+from .puzzle_state import PuzzleState
+
+
+@dataclass
+class Hint:
+    move: Tuple[int, int]  # (row, col) of the tile to slide into the blank
+    remaining: int  # optimal number of moves left, including this one
+
+
+class HintEngine:
+    def __init__(self, heuristic: Union[str, Heuristic] = "walking_distance", cache: Optional[SolutionCache] = None,
+                 time_limit: Optional[float] = None):
+        self.heuristic = get_heuristic(heuristic)
+        self.cache = cache if cache is not None else SolutionCache()
+        self.time_limit = time_limit
+        self.bounds: Dict[int, int] = {}  # lower bounds proven by searches that were cut short
+
+    def hint(self, board: Union[PuzzleState, int], cancel_event: Optional[threading.Event] = None) -> Optional[Hint]:
+        """Returns the optimal next move for a 4x4 board, or None if it is solved.
+
+        Raises SearchLimitExceeded if the time limit runs out (the bound reached
+        so far is kept for the next call) and ValueError for unsolvable boards.
+        """
+        if isinstance(board, PuzzleState):
+            board = board.to_packed()
+        if board == GOAL:
+            return None
+        step = self.cache.step(board)
+        if step is None:
+            self._plan(board, SearchLimits(time_limit=self.time_limit, cancel_event=cancel_event))
+            step = self.cache.step(board)
+        next_cell, distance = step
+        return Hint(POSITIONS[next_cell], distance)
+
+    def remaining(self, board: Union[PuzzleState, int], cancel_event: Optional[threading.Event] = None) -> int:
+        """Returns the optimal number of moves left."""
+        hint = self.hint(board, cancel_event)
+        return 0 if hint is None else hint.remaining
+
+    def _plan(self, board: int, limits: SearchLimits) -> None:
+        blank = find_blank(board)
+        search = IDAStarSearch(board, blank, self.heuristic, limits)
+        search.checkpoint = limits.start()
+
+        neighbors = []
+        for cell in NEIGHBORS[blank]:
+            child = slide(board, blank, cell)
+            step = (0, -1) if child == GOAL else self.cache.step(child)
+            if step is not None:
+                neighbors.append((step[1], cell))
+        if neighbors:
+            distance, cell = min(neighbors)
+            if self._lower_bound(board) >= distance or search.iterate(distance - 1) != FOUND:
+                # No shortcut, so the move to the planned neighbor is optimal.
+                moves = self.cache.get(slide(board, blank, cell)) if distance else []
+                if moves is not None:
+                    self.cache.put(board, [cell] + moves)
+                    return
+            else:
+                self.cache.put(board, search.path)
+                return
+
+        if not PuzzleState._is_solvable(PuzzleState.from_packed(board).state):
+            raise ValueError("Puzzle is not solvable.")
+        try:
+            moves = search.deepen(self._lower_bound(board))
+        except SearchLimitExceeded:
+            # Every bound below the one in progress has been searched in full.
+            self.bounds[board] = max(self.bounds.get(board, 0), search.bound)
+            raise
+        self.bounds.pop(board, None)
+        self.cache.put(board, moves)
+
+    def _lower_bound(self, board: int) -> int:
+        return max(self.heuristic.evaluate(board), self.bounds.get(board, 0))
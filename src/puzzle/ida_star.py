@@ -0,0 +1,104 @@
+# src/puzzle/ida_star.py
+"""
+IDA* Search
+-----------
+Iterative-deepening A* over packed boards. Memory use is proportional to the
+solution depth: only the current path is kept, the move that would undo the
+previous one is never generated, and the heuristic is updated incrementally
+from the single tile that moves instead of being recomputed over the whole
+board.
+"""
+import logging
+from typing import List, Optional
+
+from .board import BITS, GOAL, MASK, NEIGHBORS
+from .heuristics import Heuristic, ManhattanHeuristic
+from .limits import SearchLimits
+
+FOUND = -1
+
+
+class IDAStarSearch:
+    def __init__(self, board: int, blank: int, heuristic: Optional[Heuristic] = None,
+                 limits: Optional[SearchLimits] = None, trace_every: int = 0):
+        self.board = board
+        self.blank = blank
+        self.heuristic = heuristic or ManhattanHeuristic()
+        self.limits = limits or SearchLimits()
+        self.trace_every = trace_every
+        self.bound = 0
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.max_depth = 0
+        self.checkpoint = 0
+        self.path: List[int] = []
+
+    def search(self) -> Optional[List[int]]:
+        """Runs IDA* and returns the cells the blank moves to, or None.
+
+        Raises SearchLimitExceeded when the node or time budget runs out.
+        """
+        self.checkpoint = self.limits.start()
+        return self.deepen(self.heuristic.evaluate(self.board))
+
+    def deepen(self, bound: int) -> Optional[List[int]]:
+        """Runs iterations from ``bound`` up without restarting the limits.
+
+        Any lower bound on the solution length is a valid starting bound.
+        """
+        self.bound = max(bound, self.heuristic.evaluate(self.board))
+        while True:
+            result = self.iterate(self.bound)
+            if result == FOUND:
+                return list(self.path)
+            if result == float('inf'):
+                return None
+            self.bound = result
+
+    def iterate(self, bound: int, g: int = 0, previous: int = -1):
+        """Runs one depth-first pass with the given f-bound.
+
+        The root counts as ``g`` moves deep and was entered from ``previous``,
+        so a subtree of a larger search can be searched on its own. Returns
+        FOUND (with the moves in ``path``) or the smallest f that exceeded
+        the bound. Limits are checked from ``checkpoint`` on; search() starts them.
+        """
+        h, context = self.heuristic.initial(self.board)
+        self.bound = bound
+        self.path = []
+        return self._search(self.board, self.blank, previous, g, h, context)
+
+    def _search(self, board: int, blank: int, previous: int, g: int, h: int, context):
+        f = g + h
+        if f > self.bound:
+            return f
+        if board == GOAL:
+            return FOUND
+
+        self.nodes_expanded += 1
+        if self.nodes_expanded >= self.checkpoint:
+            self.checkpoint = self.limits.check(self.nodes_expanded, self.bound)
+        if g > self.max_depth:
+            self.max_depth = g
+        if self.trace_every and self.nodes_expanded % self.trace_every == 0:
+            logging.debug("Exploring state: %016x (g=%d, h=%d, bound=%d)", board, g, h, self.bound)
+        update = self.heuristic.update
+        minimum = float('inf')
+        for target in NEIGHBORS[blank]:
+            if target == previous:  # undoing the last move is never useful
+                continue
+
+            shift = target * BITS
+            tile = (board >> shift) & MASK
+            new_board = board ^ (tile << shift) ^ (tile << (blank * BITS))
+            new_h, new_context = update(context, new_board, tile, target, blank)
+            self.nodes_generated += 1
+
+            self.path.append(target)
+            result = self._search(new_board, target, blank, g + 1, new_h, new_context)
+            if result == FOUND:
+                return FOUND
+            self.path.pop()
+            if result < minimum:
+                minimum = result
+        return minimum
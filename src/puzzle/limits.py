@@ -0,0 +1,63 @@
+# src/puzzle/limits.py
+"""
+Search Limits
+-------------
+Node and time budgets, cooperative cancellation and progress reporting shared
+by the solver engines. Engines compare their expansion counter against a
+checkpoint and only call ``check`` when they reach it, so an unlimited search
+pays a single integer comparison per node.
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+ProgressCallback = Callable[[int, int, float], None]
+
+
+class SearchLimitExceeded(Exception):
+    """Raised when a search runs out of its node or time budget."""
+
+
+class SearchCancelled(SearchLimitExceeded):
+    """Raised when a search is stopped through its cancel event."""
+
+
+class SearchLimits:
+    CHECK_INTERVAL = 1024
+
+    def __init__(self, node_limit: Optional[int] = None, time_limit: Optional[float] = None,
+                 cancel_event: Optional[threading.Event] = None, on_progress: Optional[ProgressCallback] = None):
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.cancel_event = cancel_event
+        self.on_progress = on_progress
+        self.start_time = 0.0
+        self.deadline: Optional[float] = None
+
+    def start(self) -> int:
+        """Starts the clock and returns the first checkpoint."""
+        self.start_time = time.monotonic()
+        if self.time_limit is not None:
+            self.deadline = self.start_time + self.time_limit
+        return self.check(0)
+
+    def check(self, nodes: int, bound: int = 0) -> int:
+        """Raises if the budget is spent, otherwise returns the next checkpoint.
+
+        ``bound`` is the engine's current f-bound, passed on to the progress callback.
+        """
+        if self.node_limit is not None and nodes > self.node_limit:
+            raise SearchLimitExceeded(f"Node limit of {self.node_limit} exceeded")
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise SearchLimitExceeded(f"Time limit of {self.time_limit} seconds exceeded")
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise SearchCancelled("Search cancelled")
+        if self.on_progress is not None and nodes:
+            self.on_progress(nodes, bound, time.monotonic() - self.start_time)
+        if self.deadline is None and self.node_limit is None and self.cancel_event is None \
+                and self.on_progress is None:
+            return float('inf')
+        checkpoint = nodes + self.CHECK_INTERVAL
+        if self.node_limit is not None:
+            checkpoint = min(checkpoint, self.node_limit + 1)
+        return checkpoint
@@ -0,0 +1,150 @@
+# src/puzzle/parallel.py
+"""
+Parallel IDA*
+-------------
+IDA* for a single board on several cores. Every iteration expands the root
+breadth-first, within the current f-bound, until there are a few subtrees per
+worker; the subtrees are then searched with the same bound in a process pool.
+The next bound is the smallest f that exceeded the bound anywhere, exactly as
+in serial IDA*, so the first solution found is optimal: no shorter one fits
+under the previous bound, and none longer fits under this one.
+
+A solution in one subtree stops the others through a shared event, and the
+parent enforces the node and time limits between results.
+"""
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from .board import BITS, GOAL, MASK, NEIGHBORS
+from .heuristics import Heuristic, ManhattanHeuristic
+from .ida_star import FOUND, IDAStarSearch
+from .limits import SearchCancelled, SearchLimits
+
+TASKS_PER_WORKER = 8  # subtrees per worker, so uneven subtrees still balance
+MAX_SPLIT_DEPTH = 16
+POLL_INTERVAL = 0.05  # seconds between limit checks while waiting for workers
+
+_worker_heuristic: Optional[Heuristic] = None
+_worker_cancel = None
+
+
+def _init_worker(heuristic: Heuristic, cancel_event) -> None:
+    global _worker_heuristic, _worker_cancel
+    _worker_heuristic, _worker_cancel = heuristic, cancel_event
+    heuristic.evaluate(GOAL)
+
+
+def _search_subtree(board: int, blank: int, previous: int, g: int,
+                    bound: int) -> Tuple[float, Optional[List[int]], int, int]:
+    """Returns (FOUND or next bound, moves below the subtree root, expanded, generated)."""
+    limits = SearchLimits(cancel_event=_worker_cancel)
+    search = IDAStarSearch(board, blank, _worker_heuristic, limits)
+    search.checkpoint = limits.start()
+    try:
+        result = search.iterate(bound, g, previous)
+    except SearchCancelled:  # another subtree already holds the answer
+        result = float('inf')
+    path = list(search.path) if result == FOUND else None
+    return result, path, search.nodes_expanded, search.nodes_generated
+
+
+class ParallelIDAStarSearch:
+    def __init__(self, board: int, blank: int, heuristic: Optional[Heuristic] = None,
+                 limits: Optional[SearchLimits] = None, workers: Optional[int] = None):
+        self.board = board
+        self.blank = blank
+        self.heuristic = heuristic or ManhattanHeuristic()
+        self.limits = limits or SearchLimits()
+        self.workers = workers or os.cpu_count() or 1
+        self.bound = 0
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.split_depth = 0
+
+    def search(self) -> Optional[List[int]]:
+        """Runs parallel IDA* and returns the cells the blank moves to, or None.
+
+        Raises SearchLimitExceeded when the node or time budget runs out.
+        """
+        self.limits.start()
+        self.bound = self.heuristic.evaluate(self.board)
+        context = multiprocessing.get_context()
+        cancel_event = context.Event()
+        with ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(self.heuristic, cancel_event)) as pool:
+            try:
+                while True:
+                    frontier, minimum, path = self._split()
+                    if path is None and frontier:
+                        path, subtree_minimum = self._search_frontier(pool, frontier)
+                        minimum = min(minimum, subtree_minimum)
+                    if path is not None:
+                        return path
+                    if minimum == float('inf'):
+                        return None
+                    self.bound = minimum
+            finally:
+                cancel_event.set()
+
+    def _split(self) -> Tuple[List[Tuple[int, int, int, List[int]]], float, Optional[List[int]]]:
+        """Expands the root breadth-first within the bound until every worker has work.
+
+        Returns the frontier as (board, blank, previous cell, moves) tuples, the
+        smallest f pruned on the way, and the moves to the goal if it was reached.
+        """
+        heuristic = self.heuristic
+        h, context = heuristic.initial(self.board)
+        layer = [(self.board, self.blank, -1, [], context)]
+        minimum = float('inf')
+        target = self.workers * TASKS_PER_WORKER
+        depth = 0
+        while layer and len(layer) < target and depth < MAX_SPLIT_DEPTH:
+            next_layer = []
+            for board, blank, previous, path, context in layer:
+                if board == GOAL:
+                    return [], minimum, path
+                self.nodes_expanded += 1
+                for target_cell in NEIGHBORS[blank]:
+                    if target_cell == previous:
+                        continue
+                    shift = target_cell * BITS
+                    tile = (board >> shift) & MASK
+                    new_board = board ^ (tile << shift) ^ (tile << (blank * BITS))
+                    new_h, new_context = heuristic.update(context, new_board, tile, target_cell, blank)
+                    self.nodes_generated += 1
+                    f = depth + 1 + new_h
+                    if f > self.bound:
+                        minimum = min(minimum, f)
+                        continue
+                    next_layer.append((new_board, target_cell, blank, path + [target_cell], new_context))
+            layer = next_layer
+            depth += 1
+        self.split_depth = max(self.split_depth, depth)
+        return [(board, blank, previous, path) for board, blank, previous, path, _ in layer], minimum, None
+
+    def _search_frontier(self, pool: ProcessPoolExecutor,
+                         frontier: List[Tuple[int, int, int, List[int]]]) -> Tuple[Optional[List[int]], float]:
+        """Searches every frontier subtree with the current bound."""
+        pending: Dict = {
+            pool.submit(_search_subtree, board, blank, previous, len(path), self.bound): path
+            for board, blank, previous, path in frontier
+        }
+        minimum = float('inf')
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    prefix = pending.pop(future)
+                    result, path, expanded, generated = future.result()
+                    self.nodes_expanded += expanded
+                    self.nodes_generated += generated
+                    if result == FOUND:
+                        return prefix + path, minimum
+                    minimum = min(minimum, result)
+                self.limits.check(self.nodes_expanded, self.bound)
+            return None, minimum
+        finally:
+            for future in pending:
+                future.cancel()
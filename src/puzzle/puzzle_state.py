@@ -9,21 +9,20 @@ from typing import List, Tuple, Optional
 import random
 import logging
 
+from .board import SIZE, bits_for, pack, unpack
+
 logging.basicConfig(level=logging.INFO)
 class PuzzleState:
-    def __init__(self, state: Optional[List[List[int]]] = None):
-        self.size = 4
+    def __init__(self, state: Optional[List[List[int]]] = None, size: int = SIZE):
+        self.size = len(state) if state else size
         self.state = state if state else self._create_goal_state()
         self.blank_position = self._find_blank()
 
     def _create_goal_state(self) -> List[List[int]]:
-        
-        state = [
-            [1, 2, 3, 4],
-            [5, 6, 7, 8],
-            [9, 10, 11, 12],
-            [13, 14, 15, 0]  # 0 represents the blank tile
-        ]
+        # Tiles 1..n*n-1 in row-major order; 0 represents the blank tile
+        n = self.size
+        state = [[row * n + col + 1 for col in range(n)] for row in range(n)]
+        state[n - 1][n - 1] = 0
         return state
 
     def _find_blank(self) -> Tuple[int, int]:
@@ -48,11 +47,14 @@ class PuzzleState:
 
         # Find the row of the blank tile (0)
         blank_row = next(i for i, row in enumerate(state) if 0 in row)
-
-        # For 4x4 grids:
-        # - If the blank is on an even row from the bottom (0-indexed), inversions must be odd
-        # - If the blank is on an odd row from the bottom, inversions must be even
-        return (inversions % 2 == 0) if (3 - blank_row) % 2 == 0 else (inversions % 2 != 0)
+        size = len(state)
+
+        # For odd widths every move keeps the inversion parity, so it must be even.
+        # For even widths a vertical move flips it, so inversions plus the blank's
+        # row counted from the bottom (0-indexed) must be even.
+        if size % 2 == 1:
+            return inversions % 2 == 0
+        return (inversions + (size - 1 - blank_row)) % 2 == 0
     
     def is_solvable(self) -> bool:
         """Check if the current puzzle state is solvable."""
@@ -60,15 +62,15 @@ class PuzzleState:
 
 
     @staticmethod
-    def create_random_state() -> 'PuzzleState':
+    def create_random_state(size: int = SIZE) -> 'PuzzleState':
         """Creates a random solvable puzzle state using Fisher-Yates shuffle."""
         while True:
             # Flatten the goal state into a 1D list
-            tiles = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 0]
+            tiles = list(range(1, size * size)) + [0]
             random.shuffle(tiles)  # Shuffle the tiles
 
-            # Convert back to a 4x4 grid
-            state = [tiles[i:i + 4] for i in range(0, 16, 4)]
+            # Convert back to a size x size grid
+            state = [tiles[i:i + size] for i in range(0, size * size, size)]
 
             # Check if the shuffled state is solvable
             if PuzzleState._is_solvable(state):
@@ -105,7 +107,7 @@ class PuzzleState:
         x, y = self.blank_position
         for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # right, down, left, up
             new_x, new_y = x + dx, y + dy
-            if 0 <= new_x < 4 and 0 <= new_y < 4:  # Change from 3 to 4
+            if 0 <= new_x < self.size and 0 <= new_y < self.size:
                 moves.append((new_x, new_y))
         return moves
 
@@ -123,13 +125,17 @@ class PuzzleState:
 
     def is_goal_state(self) -> bool:
         """Checks if current state is goal state"""
-        goal = [
-            [1, 2, 3, 4],
-            [5, 6, 7, 8],
-            [9, 10, 11, 12],
-            [13, 14, 15, 0]
-        ]
-        return self.state == goal
+        return self.state == self._create_goal_state()
+
+    def to_packed(self) -> int:
+        """Returns the board packed into a single integer (see board.py)"""
+        return pack((tile for row in self.state for tile in row), bits_for(self.size))
+
+    @classmethod
+    def from_packed(cls, board: int, size: int = SIZE) -> 'PuzzleState':
+        """Creates a puzzle state from a packed integer board"""
+        tiles = unpack(board, size * size, bits_for(size))
+        return cls([tiles[i:i + size] for i in range(0, size * size, size)])
 
     def __str__(self) -> str:
         """String representation of puzzle state"""
@@ -143,4 +149,4 @@ class PuzzleState:
 
     def __hash__(self) -> int:
         """Generates hash of puzzle state for use in sets/dicts"""
-        return hash(str(self.state))
\ No newline at end of file
+        return hash(self.to_packed())
\ No newline at end of file
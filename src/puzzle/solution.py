@@ -0,0 +1,114 @@
+# src/puzzle/solution.py
+"""
+Compact Solutions
+-----------------
+A solution stored as the starting board plus one 2-bit direction per move
+(the direction the blank travels), four moves to a byte. Intermediate boards
+are replayed lazily from the packed start board, so a solution of any length
+costs a quarter of a byte per move until someone actually walks through it.
+
+Binary format (``to_bytes``): MAGIC, then ``<BI`` (board side, move count),
+one byte per cell with the starting tiles, then the packed directions.
+"""
+import struct
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Tuple
+
+from .board import SIZE, bits_for, find_blank, pack, slide, unpack
+from .puzzle_state import PuzzleState
+
+MAGIC = b"SOL1"
+_HEADER = struct.Struct("<BI")
+
+# Directions the blank moves in, in the same order as board.build_neighbors.
+RIGHT, DOWN, LEFT, UP = range(4)
+LETTERS = "RDLU"
+
+
+@dataclass
+class Solution:
+    board: int
+    size: int = SIZE
+    length: int = 0
+    data: bytes = b""
+
+    @classmethod
+    def from_cells(cls, board: int, cells: Iterable[int], size: int = SIZE) -> "Solution":
+        """Builds a solution from the cells the blank moves to, starting on ``board``."""
+        blank = find_blank(board, size * size, bits_for(size))
+        offsets = {1: RIGHT, size: DOWN, -1: LEFT, -size: UP}
+        data = bytearray()
+        length = 0
+        for cell in cells:
+            direction = offsets.get(cell - blank)
+            if direction is None or not 0 <= cell < size * size \
+                    or (direction in (RIGHT, LEFT) and cell // size != blank // size):
+                raise ValueError(f"Cell {cell} is not adjacent to the blank at cell {blank}")
+            if not length % 4:
+                data.append(0)
+            data[-1] |= direction << (2 * (length % 4))
+            blank = cell
+            length += 1
+        return cls(board, size, length, bytes(data))
+
+    @classmethod
+    def from_moves(cls, state: PuzzleState, moves: Iterable[Tuple[int, int]]) -> "Solution":
+        """Builds a solution from (row, col) moves as returned by PuzzleSolver.solve()."""
+        size = state.size
+        return cls.from_cells(state.to_packed(), (row * size + col for row, col in moves), size)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def directions(self) -> Iterator[int]:
+        for index in range(self.length):
+            yield (self.data[index >> 2] >> (2 * (index & 3))) & 3
+
+    def cells(self) -> Iterator[int]:
+        """Yields the cell the blank moves to on every move."""
+        size = self.size
+        offsets = (1, size, -1, -size)
+        blank = find_blank(self.board, size * size, bits_for(size))
+        for direction in self.directions():
+            blank += offsets[direction]
+            yield blank
+
+    def moves(self) -> Iterator[Tuple[int, int]]:
+        """Yields (row, col) moves, like PuzzleSolver.solve()."""
+        for cell in self.cells():
+            yield divmod(cell, self.size)
+
+    def boards(self) -> Iterator[int]:
+        """Yields the packed board before the first move and after every move."""
+        bits = bits_for(self.size)
+        board = self.board
+        blank = find_blank(board, self.size * self.size, bits)
+        yield board
+        for cell in self.cells():
+            board = slide(board, blank, cell, bits)
+            blank = cell
+            yield board
+
+    def states(self) -> Iterator[PuzzleState]:
+        """Yields PuzzleState objects from the initial state to the last, one at a time."""
+        for board in self.boards():
+            yield PuzzleState.from_packed(board, self.size)
+
+    def __str__(self) -> str:
+        return "".join(LETTERS[direction] for direction in self.directions())
+
+    def to_bytes(self) -> bytes:
+        tiles = bytes(unpack(self.board, self.size * self.size, bits_for(self.size)))
+        return MAGIC + _HEADER.pack(self.size, self.length) + tiles + self.data
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "Solution":
+        if payload[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a serialized solution")
+        size, length = _HEADER.unpack_from(payload, len(MAGIC))
+        start = len(MAGIC) + _HEADER.size
+        tiles: List[int] = list(payload[start:start + size * size])
+        data = payload[start + size * size:]
+        if len(tiles) != size * size or len(data) != (length + 3) // 4:
+            raise ValueError("Truncated solution payload")
+        return cls(pack(tiles, bits_for(size)), size, length, bytes(data))
@@ -1,114 +1,303 @@
 # src/puzzle/solver.py
-from typing import List, Tuple, Optional
-import heapq
-from copy import deepcopy
+from typing import List, Tuple, Optional, Union
+from array import array
 from .puzzle_state import PuzzleState
+from .board import BITS, GOAL, MASK, NEIGHBORS, POSITIONS, SIZE, find_blank
+from .buckets import BucketQueue
+from .heuristics import Heuristic, get_heuristic
+from .anytime import AnytimeResult, AnytimeSearch
+from .cache import SolutionCache
+from .ida_star import IDAStarSearch
+from .parallel import ParallelIDAStarSearch
+from .staged import StagedSolver
+from .limits import ProgressCallback, SearchLimits
+from .solution import Solution
+from .stats import SearchStats, TimedHeuristic
+import threading
 import time
 import logging
-from functools import lru_cache
+import tracemalloc
+from contextlib import contextmanager
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-class Node:
-    def __init__(self, state: PuzzleState, parent: Optional['Node'] = None, move: Optional[Tuple[int, int]] = None):
-        self.state = state
-        self.parent = parent
-        self.move = move
-        self.g = 0 if parent is None else parent.g + 1
-        self.h = self._calculate_manhattan()
-        self.f = self.g + self.h
-
-    @lru_cache(maxsize=None)
-    def _calculate_manhattan(self) -> int:
-        """Calculate Manhattan distance heuristic."""
-        distance = 0
-        goal_positions = {
-            1: (0, 0), 2: (0, 1), 3: (0, 2), 4: (0, 3),
-            5: (1, 0), 6: (1, 1), 7: (1, 2), 8: (1, 3),
-            9: (2, 0), 10: (2, 1), 11: (2, 2), 12: (2, 3),
-            13: (3, 0), 14: (3, 1), 15: (3, 2), 0: (3, 3)
-        }
-
-        for i in range(4):
-            for j in range(4):
-                value = self.state.state[i][j]
-                if value != 0:
-                    goal_x, goal_y = goal_positions[value]
-                    distance += abs(goal_x - i) + abs(goal_y - j)
-        return distance
-
-    def __lt__(self, other: 'Node') -> bool:
-        return self.f < other.f
+
+ENGINES = ("astar", "ida", "parallel", "staged")
+
+# Estimated bytes per A* node (board, parent index, blank, heuristic context and
+# best-g entry), measured with tracemalloc and rounded up.
+ASTAR_NODE_BYTES = 192
 
 
 class PuzzleSolver:
-    def __init__(self, initial_state: PuzzleState):
+    def __init__(self, initial_state: PuzzleState, engine: str = "astar",
+                 heuristic: Union[str, Heuristic] = "manhattan",
+                 node_limit: Optional[int] = None, time_limit: Optional[float] = None,
+                 cache: Optional[SolutionCache] = None, cancel_event: Optional[threading.Event] = None,
+                 on_progress: Optional[ProgressCallback] = None, trace_every: int = 0,
+                 profile: bool = False, workers: Optional[int] = None, memory_limit: Optional[int] = None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Expected one of {ENGINES}.")
+        if engine != "staged" and initial_state.size != SIZE:
+            raise ValueError(f"The {engine} engine only solves {SIZE}x{SIZE} boards; use engine='staged'.")
         self.initial_state = initial_state
+        self.engine = engine
+        self.heuristic = get_heuristic(heuristic)
+        self.limits = SearchLimits(node_limit, time_limit, cancel_event, on_progress)
+        self.cache = cache
+        self.trace_every = trace_every
+        self.profile = profile
+        self.workers = workers  # processes for the parallel engine (default: CPU count)
+        self.memory_limit = memory_limit  # bytes A* may use before it hands over to IDA*
+        self.stats = SearchStats(engine=engine, heuristic=self.heuristic.name)
+
+    @property
+    def nodes_expanded(self) -> int:
+        return self.stats.nodes_expanded
 
     def solve(self) -> Optional[List[Tuple[int, int]]]:
-        """Solve the puzzle using A* algorithm"""
+        """Solve the puzzle with the configured engine (A*, IDA* or staged)
+
+        The staged engine handles any board size but its solutions are not
+        optimal, so they are never cached. Raises SearchLimitExceeded if the node or time limit is reached first.
+        """
+        self._check_solvable()
+        
+        initial_board = self.initial_state.to_packed()
+        self.stats = SearchStats(engine=self.engine, heuristic=self.heuristic.name)
+        cache = self.cache if self.engine != "staged" else None
+        if cache is not None:
+            cells = cache.get(initial_board)
+            if cells is not None:
+                logging.info("Solution found in cache")
+                self.stats.cache_hit = True
+                self.stats.solution_length = len(cells)
+                return [POSITIONS[cell] for cell in cells]
         
+        logging.info(f"Starting to solve the puzzle with {self.engine}")
+        start_time = time.time()
+        
+        with self._measured():
+            if self.engine == "staged":
+                path = StagedSolver(self.initial_state).solve()
+            elif self.engine == "parallel":
+                path = self._solve_parallel(initial_board, find_blank(initial_board))
+            elif self.engine == "ida":
+                path = self._solve_ida(initial_board, find_blank(initial_board))
+            else:
+                path = self._solve_astar(initial_board, find_blank(initial_board))
+        
+        elapsed_time = time.time() - start_time
+        self.stats.solution_length = None if path is None else len(path)
+        if path is None:
+            logging.info(f"Failed to solve the puzzle in {elapsed_time:.2f} seconds")
+        else:
+            logging.info(f"Puzzle solved in {elapsed_time:.2f} seconds")
+            if cache is not None:
+                cache.put(initial_board, [row * SIZE + col for row, col in path])
+        return path
+
+    def solve_anytime(self, weight: float = 2.0) -> AnytimeResult:
+        """Anytime weighted A*: returns the best solution found within the limits
+
+        The result reports the solution length and a proven lower bound on the
+        optimal length, so the solution is within ``length - lower_bound`` moves
+        of optimal (and never worse than ``weight`` times optimal). Moves are
+        (row, col) positions, as in solve(). Raises SearchLimitExceeded only if
+        no solution was found at all.
+        """
+        if self.initial_state.size != SIZE:
+            raise ValueError(f"Anytime search only solves {SIZE}x{SIZE} boards.")
+        self._check_solvable()
+        
+        logging.info(f"Starting anytime search with weight {weight}")
+        start_time = time.time()
+        initial_board = self.initial_state.to_packed()
+        self.stats = SearchStats(engine="anytime", heuristic=self.heuristic.name)
+        with self._measured():
+            search = AnytimeSearch(initial_board, find_blank(initial_board), weight, self.heuristic, self.limits)
+            try:
+                result = search.search()
+            finally:
+                self._record(search.nodes_expanded, search.nodes_generated, search.peak_frontier)
+        
+        elapsed_time = time.time() - start_time
+        self.stats.solution_length = result.length
+        logging.info(f"Anytime search returned {result.length} moves (lower bound {result.lower_bound}) "
+                     f"in {elapsed_time:.2f} seconds")
+        result.moves = [POSITIONS[cell] for cell in result.moves]
+        return result
+
+    @contextmanager
+    def _measured(self):
+        """Times the search and, when profiling, the heuristic and peak memory."""
+        heuristic = self.heuristic
+        tracing = self.profile and not tracemalloc.is_tracing()
+        if self.profile:
+            self.heuristic = TimedHeuristic(heuristic)
+            if tracing:
+                tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stats.elapsed = time.perf_counter() - start
+            if self.profile:
+                self.stats.heuristic_time = self.heuristic.elapsed
+                self.stats.peak_memory = tracemalloc.get_traced_memory()[1]
+                self.heuristic = heuristic
+                if tracing:
+                    tracemalloc.stop()
+
+    def _record(self, expanded: int, generated: int, peak_frontier: int) -> None:
+        self.stats.nodes_expanded = expanded
+        self.stats.nodes_generated = generated
+        self.stats.peak_frontier = peak_frontier
+
+    def _check_solvable(self) -> None:
         logging.info("Checking puzzle solvability")
         if not PuzzleState._is_solvable(self.initial_state.state):
             logging.error("Puzzle is not solvable.")
             raise ValueError("Puzzle is not solvable.")
+
+    def _solve_astar(self, initial_board: int, initial_blank: int) -> Optional[List[Tuple[int, int]]]:
+        """A* over parallel node arrays with a bucket open list
+
+        Node ``i`` is ``boards[i]`` with the blank at ``blanks[i]`` (also the
+        cell the blank moved to), reached from node ``parents[i]``. Only the
+        heuristic context of unexpanded nodes is kept.
+
+        With a memory limit, A* stops once its nodes would outgrow it and the
+        search continues with IDA*, whose memory does not grow. The smallest f
+        on the open list is a proven lower bound on the solution length, so
+        IDA* starts from there and the answer stays optimal.
+        """
+        heuristic = self.heuristic
+        update = heuristic.update
+        trace_every = self.trace_every
+        h, context = heuristic.initial(initial_board)
+        boards = [initial_board]
+        blanks = array('b', [initial_blank])
+        parents = array('i', [-1])
+        contexts = [context]
+        best_g = {initial_board: 0}
+        frontier = BucketQueue()
+        frontier.push(h, 0, 0)
+        expanded = generated = peak_frontier = 0
+        checkpoint = self.limits.start()
+        max_nodes = float('inf') if self.memory_limit is None else self.memory_limit // ASTAR_NODE_BYTES
         
-        logging.info("Starting to solve the puzzle")
-        start_time = time.time()
-        
-        start_node = Node(self.initial_state)
-        frontier = []
-        heapq.heappush(frontier, start_node)
-        explored = set()
-        
-        while frontier:
-            current_node = heapq.heappop(frontier)
-            logging.info(f"Exploring state: {current_node.state.state}")
-            
-            if current_node.state.is_goal_state():
-                elapsed_time = time.time() - start_time
-                logging.info(f"Puzzle solved in {elapsed_time:.2f} seconds")
-                return self._reconstruct_path(current_node)
-            
-            state_str = str(current_node.state.state)
-            if state_str in explored:
-                continue
+        try:
+            while frontier:
+                if len(boards) >= max_nodes:
+                    break
                 
-            explored.add(state_str)
-            
-            for move in current_node.state.get_possible_moves():
-                new_state = PuzzleState(deepcopy(current_node.state.state))
-                new_state.move(move)
+                f, g, index = frontier.pop()
+                board = boards[index]
                 
-                if str(new_state.state) not in explored:
-                    new_node = Node(new_state, current_node, move)
-                    heapq.heappush(frontier, new_node)
+                if board == GOAL:
+                    return self._reconstruct_path(index, blanks, parents)
+                
+                if best_g[board] < g:  # reached again more cheaply since it was pushed
+                    continue
+                
+                expanded += 1
+                if expanded >= checkpoint:
+                    checkpoint = self.limits.check(expanded, f)
+                if len(frontier) > peak_frontier:
+                    peak_frontier = len(frontier)
+                if trace_every and expanded % trace_every == 0:
+                    logging.debug("Exploring state: %016x (g=%d, h=%d)", board, g, f - g)
+                
+                blank = blanks[index]
+                context, contexts[index] = contexts[index], None
+                previous = blanks[parents[index]] if index else -1
+                new_g = g + 1
+                for target in NEIGHBORS[blank]:
+                    if target == previous:  # undoing the last move is never useful
+                        continue
+                    shift = target * BITS
+                    tile = (board >> shift) & MASK
+                    new_board = board ^ (tile << shift) ^ (tile << (blank * BITS))
+                    if best_g.get(new_board, new_g + 1) <= new_g:
+                        continue
+                    
+                    best_g[new_board] = new_g
+                    new_h, new_context = update(context, new_board, tile, target, blank)
+                    boards.append(new_board)
+                    blanks.append(target)
+                    parents.append(index)
+                    contexts.append(new_context)
+                    frontier.push(new_g + new_h, new_g, len(boards) - 1)
+                    generated += 1
+            else:
+                return None
+        finally:
+            self._record(expanded, generated, peak_frontier)
         
-        elapsed_time = time.time() - start_time
-        logging.info(f"Failed to solve the puzzle in {elapsed_time:.2f} seconds")
-        return None
+        lower_bound = frontier.min_f
+        del boards, blanks, parents, contexts, best_g, frontier
+        return self._fall_back_to_ida(initial_board, initial_blank, lower_bound, expanded, generated,
+                                      peak_frontier, checkpoint)
 
-    def _reconstruct_path(self, node: Node) -> List[Tuple[int, int]]:
-        """Reconstruct the path from initial state to goal"""
+    def _fall_back_to_ida(self, initial_board: int, initial_blank: int, lower_bound: int, expanded: int,
+                          generated: int, peak_frontier: int, checkpoint: int) -> Optional[List[Tuple[int, int]]]:
+        """Continues an A* search that hit its memory limit with IDA* from A*'s lower bound"""
+        logging.info(f"Memory limit reached after {generated} nodes; continuing with IDA* from bound {lower_bound}")
+        search = IDAStarSearch(initial_board, initial_blank, self.heuristic, self.limits, self.trace_every)
+        search.nodes_expanded, search.nodes_generated, search.checkpoint = expanded, generated, checkpoint
+        try:
+            cells = search.deepen(lower_bound)
+        finally:
+            self._record(search.nodes_expanded, search.nodes_generated, peak_frontier)
+        if cells is None:
+            return None
+        return [POSITIONS[cell] for cell in cells]
+
+    def _solve_ida(self, initial_board: int, initial_blank: int) -> Optional[List[Tuple[int, int]]]:
+        """IDA* search using O(depth) memory"""
+        search = IDAStarSearch(initial_board, initial_blank, self.heuristic, self.limits, self.trace_every)
+        try:
+            cells = search.search()
+        finally:
+            # The path is all IDA* keeps, so its frontier peak is the deepest path.
+            self._record(search.nodes_expanded, search.nodes_generated, search.max_depth)
+        if cells is None:
+            return None
+        return [POSITIONS[cell] for cell in cells]
+
+    def _solve_parallel(self, initial_board: int, initial_blank: int) -> Optional[List[Tuple[int, int]]]:
+        """IDA* with the tree split across worker processes"""
+        search = ParallelIDAStarSearch(initial_board, initial_blank, self.heuristic, self.limits, self.workers)
+        try:
+            cells = search.search()
+        finally:
+            self._record(search.nodes_expanded, search.nodes_generated, search.split_depth)
+        if cells is None:
+            return None
+        return [POSITIONS[cell] for cell in cells]
+
+    def _reconstruct_path(self, index: int, blanks: array, parents: array) -> List[Tuple[int, int]]:
+        """Reconstruct the path from initial state to goal by following parent indices"""
         path = []
-        while node.parent is not None:
-            path.append(node.move)
-            node = node.parent
+        while parents[index] >= 0:
+            path.append(POSITIONS[blanks[index]])
+            index = parents[index]
         return path[::-1]
 
-    def get_solution_states(self) -> Optional[List[PuzzleState]]:
-        """Returns list of states from initial to goal state"""
+    def get_solution(self) -> Optional[Solution]:
+        """Solves the puzzle and returns the moves as a compact Solution"""
         moves = self.solve()
         if moves is None:
             return None
+        return Solution.from_moves(self.initial_state, moves)
 
-        states = [deepcopy(self.initial_state)]
-        current_state = deepcopy(self.initial_state)
-        
-        for move in moves:
-            current_state = PuzzleState(deepcopy(current_state.state))
-            current_state.move(move)
-            states.append(deepcopy(current_state))
-            
-        return states
+    def get_solution_states(self) -> Optional[List[PuzzleState]]:
+        """Returns list of states from initial to goal state
 
+        Prefer get_solution().states() to replay the states lazily.
+        """
+        solution = self.get_solution()
+        if solution is None:
+            return None
+        return list(solution.states())
@@ -0,0 +1,235 @@
+# src/puzzle/staged.py
+"""
+Staged Solver
+-------------
+Fast, suboptimal solver for boards of any size. It solves the way people do:
+place the top row of the unsolved region, then its left column, shrink the
+region by one and repeat until only a small core is left, which is solved
+optimally with IDA*. Finally, any stretch of moves that returns the board to
+an earlier position is cut out of the sequence.
+
+Ordinary tiles are walked to their cell one step at a time, routing the blank
+around them. The last two tiles of a row or column cannot be placed that way
+without disturbing their neighbour, so they are first brought near their goal
+and then finished with a tiny breadth-first search inside a 3x3 window.
+"""
+import random
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .board import build_neighbors
+from .puzzle_state import PuzzleState
+
+
+class StagedSolver:
+    def __init__(self, initial_state: PuzzleState, core_size: int = 3):
+        if core_size < 2:
+            raise ValueError("Core size must be at least 2.")
+        self.initial_state = initial_state
+        self.size = initial_state.size
+        self.core_size = min(core_size, self.size)
+        self.neighbors = build_neighbors(self.size)
+
+    def solve(self) -> List[Tuple[int, int]]:
+        """Returns (row, col) positions the blank moves to, like PuzzleSolver.solve()."""
+        if not PuzzleState._is_solvable(self.initial_state.state):
+            raise ValueError("Puzzle is not solvable.")
+
+        n = self.size
+        self.tiles = [tile for row in self.initial_state.state for tile in row]
+        self.where = [0] * (n * n)
+        for cell, tile in enumerate(self.tiles):
+            self.where[tile] = cell
+        self.locked = [False] * (n * n)
+        self.moves: List[int] = []
+
+        top = 0
+        while n - top > self.core_size:
+            # Window cells are row-major; the last two tiles are parked at the
+            # given window indices, one step in from the region's edge.
+            self._solve_line([top * n + col for col in range(top, n)],
+                             self._window(top, n - 3), parking=(7, 8))
+            self._solve_line([row * n + top for row in range(top + 1, n)],
+                             self._window(n - 3, top), parking=(5, 8))
+            top += 1
+        self._solve_core(top)
+
+        moves = self._smooth([tile for row in self.initial_state.state for tile in row], self.moves)
+        return [divmod(cell, n) for cell in moves]
+
+    # -- board operations -------------------------------------------------
+
+    def _slide(self, target: int) -> None:
+        """Moves the blank onto ``target``; the tile there takes the blank's cell."""
+        blank = self.where[0]
+        tile = self.tiles[target]
+        self.tiles[blank], self.tiles[target] = tile, 0
+        self.where[tile], self.where[0] = blank, target
+        self.moves.append(target)
+
+    def _path(self, start: int, goal: int, avoid: int = -1) -> List[int]:
+        """Shortest path of cells from start to goal through unlocked cells."""
+        parents = {start: start}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            if cell == goal:
+                break
+            for neighbor in self.neighbors[cell]:
+                if neighbor not in parents and neighbor != avoid and not self.locked[neighbor]:
+                    parents[neighbor] = cell
+                    queue.append(neighbor)
+        if goal not in parents:
+            raise RuntimeError(f"No free path from cell {start} to cell {goal}")
+        path = [goal]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def _route_blank(self, goal: int, avoid: int = -1) -> None:
+        for cell in self._path(self.where[0], goal, avoid)[1:]:
+            self._slide(cell)
+
+    def _move_tile(self, tile: int, goal: int) -> None:
+        for cell in self._path(self.where[tile], goal)[1:]:
+            self._route_blank(cell, avoid=self.where[tile])
+            self._slide(self.where[tile])
+
+    # -- stages -----------------------------------------------------------
+
+    def _window(self, row: int, col: int) -> List[int]:
+        n = self.size
+        return [r * n + c for r in range(row, row + 3) for c in range(col, col + 3)]
+
+    def _solve_line(self, cells: Sequence[int], window: List[int], parking: Tuple[int, int]) -> None:
+        """Places the goal tiles of a row or column and locks them."""
+        for cell in cells[:-2]:
+            self._move_tile(cell + 1, cell)
+            self.locked[cell] = True
+
+        first, second = cells[-2], cells[-1]
+        first_tile, second_tile = first + 1, second + 1
+        if self.where[first_tile] != first or self.where[second_tile] != second:
+            second_park, first_park = window[parking[0]], window[parking[1]]
+            self._move_tile(second_tile, second_park)
+            self.locked[second_park] = True
+            self._move_tile(first_tile, first_park)
+            self.locked[first_park] = True
+
+            inside = {cell for cell in window if not self.locked[cell]} | {first_park, second_park}
+            if self.where[0] not in inside:
+                self._route_blank(next(cell for cell in window if cell in inside and not self.locked[cell]))
+            self.locked[first_park] = self.locked[second_park] = False
+
+            for cell in self._window_search(inside, first_tile, second_tile, first, second):
+                self._slide(cell)
+        self.locked[first] = self.locked[second] = True
+
+    def _window_search(self, window: set, first_tile: int, second_tile: int,
+                       first: int, second: int) -> List[int]:
+        """BFS over (first tile, second tile, blank) cells restricted to the window."""
+        start = (self.where[first_tile], self.where[second_tile], self.where[0])
+        parents: Dict[Tuple[int, int, int], Optional[Tuple[Tuple[int, int, int], int]]] = {start: None}
+        queue = deque([start])
+        while queue:
+            state = queue.popleft()
+            a, b, blank = state
+            if a == first and b == second:
+                moves = []
+                while parents[state] is not None:
+                    state, cell = parents[state]
+                    moves.append(cell)
+                return moves[::-1]
+            for cell in self.neighbors[blank]:
+                if cell not in window:
+                    continue
+                child = (blank if cell == a else a, blank if cell == b else b, cell)
+                if child not in parents:
+                    parents[child] = (state, cell)
+                    queue.append(child)
+        raise RuntimeError("Window search failed to place the last two tiles")
+
+    def _solve_core(self, top: int) -> None:
+        """Solves the remaining bottom-right k x k region optimally with IDA*."""
+        n = self.size
+        cells = [row * n + col for row in range(top, n) for col in range(top, n)]
+        inside = set(cells)
+        goal_of = {cell + 1: cell for cell in cells if cell != n * n - 1}
+        distance = {}
+        for tile, goal in goal_of.items():
+            goal_row, goal_col = divmod(goal, n)
+            for cell in cells:
+                row, col = divmod(cell, n)
+                distance[tile, cell] = abs(goal_row - row) + abs(goal_col - col)
+
+        tiles, neighbors = self.tiles, self.neighbors
+        path: List[int] = []
+
+        def search(blank: int, previous: int, g: int, h: int, bound: int) -> float:
+            f = g + h
+            if f > bound:
+                return f
+            if h == 0:
+                return -1
+            minimum = float('inf')
+            for cell in neighbors[blank]:
+                if cell == previous or cell not in inside:
+                    continue
+                tile = tiles[cell]
+                new_h = h - distance[tile, cell] + distance[tile, blank]
+                tiles[blank], tiles[cell] = tile, 0
+                path.append(cell)
+                result = search(cell, blank, g + 1, new_h, bound)
+                tiles[blank], tiles[cell] = 0, tile
+                if result == -1:
+                    return -1
+                path.pop()
+                minimum = min(minimum, result)
+            return minimum
+
+        h = sum(distance[tiles[cell], cell] for cell in cells if tiles[cell])
+        bound = h
+        while True:
+            result = search(self.where[0], -1, 0, h, bound)
+            if result == -1:
+                break
+            bound = result
+        for cell in path:
+            self._slide(cell)
+
+    # -- smoothing --------------------------------------------------------
+
+    def _smooth(self, tiles: List[int], moves: Sequence[int]) -> List[int]:
+        """Removes every loop that brings the board back to an earlier position.
+
+        Positions are identified by a Zobrist hash, updated per move.
+        """
+        rng = random.Random(0)
+        keys = [[rng.getrandbits(64) for _ in tiles] for _ in tiles]
+        tiles = list(tiles)
+        blank = tiles.index(0)
+        key = 0
+        for cell, tile in enumerate(tiles):
+            key ^= keys[tile][cell]
+
+        seen = {key: 0}
+        history = [key]
+        smoothed: List[int] = []
+        for target in moves:
+            tile = tiles[target]
+            key ^= keys[tile][target] ^ keys[tile][blank] ^ keys[0][blank] ^ keys[0][target]
+            tiles[blank], tiles[target] = tile, 0
+            blank = target
+
+            if key in seen:
+                # Back at an earlier position: drop the loop.
+                index = seen[key]
+                for dropped in history[index + 1:]:
+                    del seen[dropped]
+                del history[index + 1:]
+                del smoothed[index:]
+            else:
+                smoothed.append(target)
+                seen[key] = len(smoothed)
+                history.append(key)
+        return smoothed
@@ -0,0 +1,67 @@
+# src/puzzle/stats.py
+"""
+Search Statistics
+-----------------
+Structured counters reported by PuzzleSolver after every search, plus a
+heuristic wrapper that measures time spent evaluating it. Timing the
+heuristic and tracking peak memory both cost something, so they are only
+collected when profiling is requested.
+"""
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Tuple
+
+from .heuristics import Heuristic
+
+
+@dataclass
+class SearchStats:
+    engine: str = ""
+    heuristic: str = ""
+    nodes_generated: int = 0
+    nodes_expanded: int = 0
+    peak_frontier: int = 0
+    elapsed: float = 0.0
+    heuristic_time: Optional[float] = None
+    peak_memory: Optional[int] = None  # bytes allocated by Python at the peak
+    solution_length: Optional[int] = None
+    cache_hit: bool = False
+
+    @property
+    def expansions_per_second(self) -> float:
+        return self.nodes_expanded / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["expansions_per_second"] = self.expansions_per_second
+        return data
+
+
+class TimedHeuristic(Heuristic):
+    """Wraps a heuristic and accumulates the time spent in it."""
+
+    def __init__(self, heuristic: Heuristic):
+        self.heuristic = heuristic
+        self.name = heuristic.name
+        self.elapsed = 0.0
+
+    def evaluate(self, board: int) -> int:
+        start = time.perf_counter()
+        try:
+            return self.heuristic.evaluate(board)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    def initial(self, board: int) -> Tuple[int, Any]:
+        start = time.perf_counter()
+        try:
+            return self.heuristic.initial(board)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    def update(self, context: Any, board: int, tile: int, source: int, destination: int) -> Tuple[int, Any]:
+        start = time.perf_counter()
+        try:
+            return self.heuristic.update(context, board, tile, source, destination)
+        finally:
+            self.elapsed += time.perf_counter() - start
@@ -0,0 +1,334 @@
+# src/service.py
+"""
+Solve Service
+-------------
+A small asyncio HTTP/JSON server that solves boards in a worker process pool.
+
+    POST /solve    {"board": [5, 1, 2, 3, ...], "engine": "ida", "heuristic": "walking_distance",
+                    "timeout": 5}
+                   -> {"status": "solved", "length": 9, "moves": "UUURRRDDD", "coalesced": false, ...}
+    GET  /metrics  request counters, queue depth and latency percentiles
+    GET  /health
+
+Concurrent requests for the same board are merged into one solve. 4x4 boards
+are keyed by their canonical form under diagonal reflection (see cache.py),
+so a board and its mirror image share a solve and the moves are mirrored
+back for whichever of them was reflected.
+
+Admission control: new solves wait in a bounded queue; when it is full the
+request is refused at once with 503 and a Retry-After header, so memory use
+stays bounded under load. Each request has a deadline (its "timeout", capped
+by the server's maximum, from when it arrived) and gets 504 when it passes.
+A solve runs until the latest deadline of the requests waiting on it: a
+request that joins a queued solve extends it, and one that would outlast a
+solve already running starts a fresh solve instead of joining it. A queued
+solve that every caller has given up on is dropped without running.
+
+Run with:
+    python -m src.service --port 8080 --workers 4
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Dict, Optional, Sequence, Tuple
+
+from .cli import parse_board
+from .puzzle.batch import LIMIT_EXCEEDED, SOLVED, BatchResult, solve_board
+from .puzzle.board import SIZE
+from .puzzle.cache import REFLECTED_CELLS, canonical
+from .puzzle.heuristics import HEURISTICS
+from .puzzle.puzzle_state import PuzzleState
+from .puzzle.solution import Solution
+from .puzzle.solver import ENGINES
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large",
+           422: "Unprocessable Entity", 500: "Internal Server Error", 503: "Service Unavailable",
+           504: "Gateway Timeout"}
+LATENCY_WINDOW = 1000  # most recent requests kept for latency percentiles
+READ_TIMEOUT = 10.0  # seconds a client gets to send its request
+
+
+class Job:
+    """One solve, shared by every request for the same key."""
+
+    def __init__(self, key: tuple, board: int, size: int, engine: str, heuristic: str, deadline: float):
+        self.key = key
+        self.board = board
+        self.size = size
+        self.engine = engine
+        self.heuristic = heuristic
+        self.deadline = deadline  # time.monotonic() by which the last waiter gives up
+        self.started = False
+        self.future: "asyncio.Future[BatchResult]" = asyncio.get_running_loop().create_future()
+        self.waiters = 0
+
+
+class SolveService:
+    def __init__(self, workers: Optional[int] = None, queue_size: int = 64, default_timeout: float = 10.0,
+                 max_timeout: float = 60.0, max_body: int = 1 << 16):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+        self.max_body = max_body
+        self.queue: Optional["asyncio.Queue[Job]"] = None
+        self.jobs: Dict[tuple, Job] = {}
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.server: Optional[asyncio.base_events.Server] = None
+        self._dispatchers = []
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.counters = dict.fromkeys(("requests", "solves", "coalesced", "rejected", "timeouts", "errors"), 0)
+
+    # -- lifecycle --------------------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """Starts the worker pool, the dispatchers and the HTTP listener."""
+        self._ensure_queue()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        # Start the workers before listening: processes forked later would
+        # inherit client sockets and keep them open after we close them.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, os.getpid) for _ in range(self.workers)))
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        self.server = await asyncio.start_server(self._handle, host, port)
+        logging.info(f"Solve service listening on {self.address}")
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    def _ensure_queue(self) -> None:
+        if self.queue is None:
+            self.queue = asyncio.Queue(self.queue_size)
+
+    # -- solving ----------------------------------------------------------
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            try:
+                if not job.waiters:  # every caller has given up already
+                    job.future.cancel()
+                    continue
+                time_limit = job.deadline - time.monotonic()
+                if time_limit <= 0:
+                    job.future.set_result(BatchResult(0, job.board, LIMIT_EXCEEDED))
+                    continue
+                job.started = True
+                result = await loop.run_in_executor(self.pool, solve_board, 0, job.board, job.size, job.engine,
+                                                    job.heuristic, None, time_limit)
+                self.counters["solves"] += 1
+                job.future.set_result(result)
+            except Exception as e:  # reported to the waiting requests
+                if not job.future.done():
+                    job.future.set_exception(e)
+            finally:
+                if self.jobs.get(job.key) is job:
+                    del self.jobs[job.key]
+                self.queue.task_done()
+
+    async def solve(self, payload: dict) -> Tuple[int, dict]:
+        """Handles one solve request; returns the HTTP status and the response body."""
+        self._ensure_queue()
+        start_time = time.perf_counter()
+        self.counters["requests"] += 1
+        try:
+            status, body = await self._solve(payload)
+        except ValueError as e:
+            status, body = 400, {"error": str(e)}
+        finally:
+            self.latencies.append(time.perf_counter() - start_time)
+        return status, body
+
+    async def _solve(self, payload: dict) -> Tuple[int, dict]:
+        tiles = payload.get("board")
+        if isinstance(tiles, list):
+            if not all(isinstance(tile, int) and not isinstance(tile, bool) for tile in tiles):
+                raise ValueError("Board tiles must be integers")
+            tiles = " ".join(str(tile) for tile in tiles)
+        elif tiles is not None and not isinstance(tiles, str):
+            raise ValueError("Board must be a list of tiles or a string")
+        state = parse_board(tiles or "")
+        if state is None:
+            raise ValueError("Missing board")
+        engine = payload.get("engine", "ida")
+        heuristic = payload.get("heuristic", "manhattan")
+        if engine not in ENGINES or heuristic not in HEURISTICS:
+            raise ValueError(f"Engine must be one of {ENGINES} and heuristic one of {HEURISTICS}")
+        if engine != "staged" and state.size != SIZE:
+            raise ValueError(f"The {engine} engine only solves {SIZE}x{SIZE} boards; use 'staged'")
+        timeout = payload.get("timeout", self.default_timeout)
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not 0 < timeout < float("inf"):
+            raise ValueError("Timeout must be a positive number of seconds")
+        if not PuzzleState._is_solvable(state.state):
+            return 422, {"status": "unsolvable"}
+        timeout = min(float(timeout), self.max_timeout)
+        deadline = time.monotonic() + timeout
+
+        board = state.to_packed()
+        key_board, reflected = canonical(board) if state.size == SIZE else (board, False)
+        key = (key_board, state.size, engine, heuristic)
+        job = self.jobs.get(key)
+        if job is not None and job.started and job.deadline < deadline:
+            job = None  # its time limit is already set and would cut this request short
+        coalesced = job is not None
+        if coalesced:
+            self.counters["coalesced"] += 1
+            job.deadline = max(job.deadline, deadline)
+        else:
+            job = Job(key, key_board, state.size, engine, heuristic, deadline)
+            try:
+                self.queue.put_nowait(job)
+            except asyncio.QueueFull:
+                self.counters["rejected"] += 1
+                return 503, {"error": "Solve queue is full, retry later"}
+            self.jobs[key] = job
+
+        job.waiters += 1
+        try:
+            result = await asyncio.wait_for(asyncio.shield(job.future), timeout)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            return 504, {"status": "timeout", "error": f"No solution within {timeout:g} seconds"}
+        except Exception as e:
+            self.counters["errors"] += 1
+            return 500, {"error": str(e)}
+        finally:
+            job.waiters -= 1
+
+        body = {"status": result.status, "length": result.length, "moves": None, "coalesced": coalesced,
+                "elapsed": result.elapsed}
+        if result.status == SOLVED:
+            solution = result.solution
+            if reflected:
+                solution = Solution.from_cells(board, (REFLECTED_CELLS[cell] for cell in solution.cells()))
+            body["moves"] = str(solution)
+            return 200, body
+        if result.status == LIMIT_EXCEEDED:
+            self.counters["timeouts"] += 1
+            return 504, body
+        return 500, body
+
+    def metrics(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction: float) -> Optional[float]:
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] if latencies else None
+
+        return {
+            **self.counters,
+            "queue_depth": self.queue.qsize() if self.queue is not None else 0,
+            "queue_capacity": self.queue_size,
+            "in_flight": len(self.jobs),
+            "workers": self.workers,
+            "latency": {
+                "count": len(latencies),
+                "mean": sum(latencies) / len(latencies) if latencies else None,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": latencies[-1] if latencies else None,
+            },
+        }
+
+    # -- HTTP -------------------------------------------------------------
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        if method == "POST" and path == "/solve":
+            try:
+                payload = json.loads(body or b"{}")
+            except json.JSONDecodeError:
+                return 400, {"error": "Request body must be JSON"}
+            if not isinstance(payload, dict):
+                return 400, {"error": "Request body must be a JSON object"}
+            return await self.solve(payload)
+        if method == "GET" and path == "/metrics":
+            return 200, self.metrics()
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        return 404, {"error": f"No route for {method} {path}"}
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        method, path, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        if length > self.max_body:
+            raise OverflowError(length)
+        return method, path.split("?", 1)[0], await reader.readexactly(length)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, path, body = await asyncio.wait_for(self._read_request(reader), READ_TIMEOUT)
+            status, payload = await self._route(method, path, body)
+        except OverflowError:
+            status, payload = 413, {"error": f"Request body is larger than {self.max_body} bytes"}
+        except (ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            status, payload = 400, {"error": "Malformed request"}
+        except Exception:
+            # Whatever went wrong, the client still gets a response.
+            logging.exception("Request failed")
+            status, payload = 500, {"error": "Internal server error"}
+
+        data = json.dumps(payload).encode()
+        headers = [f"HTTP/1.1 {status} {REASONS[status]}", "Content-Type: application/json",
+                   f"Content-Length: {len(data)}", "Connection: close"]
+        if status == 503:
+            headers.append("Retry-After: 1")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + data)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve(host: str, port: int, **options) -> None:
+    service = SolveService(**options)
+    await service.start(host, port)
+    try:
+        await service.server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve sliding-puzzle solves over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, help="solver processes (default: CPU count)")
+    parser.add_argument("--queue-size", type=int, default=64, help="queued solves before requests are refused")
+    parser.add_argument("--timeout", type=float, default=10.0, help="default per-request deadline in seconds")
+    parser.add_argument("--max-timeout", type=float, default=60.0, help="largest deadline a request may ask for")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers, queue_size=args.queue_size,
+                          default_timeout=args.timeout, max_timeout=args.max_timeout))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,22 +4,134 @@ from tkinter import filedialog, messagebox
 import cv2
 from PIL import Image, ImageTk
 import numpy as np
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import queue
+import threading
 import time
 
+from ..puzzle.board import SIZE
+from ..puzzle.cache import SolutionCache
+from ..puzzle.hints import Hint, HintEngine
+from ..puzzle.limits import SearchCancelled
+from ..puzzle.pattern_database import DEFAULT_PDB_PATH
 from ..puzzle.puzzle_state import PuzzleState
 from ..puzzle.solver import PuzzleSolver
-from ..image_processing.image_handler import ImageHandler
+from ..image_processing.image_handler import ImageHandler, TileCache
+
+PROGRESS_INTERVAL = 0.1  # seconds between progress reports
+POLL_INTERVAL_MS = 100
+FRAME_INTERVAL_MS = 16  # ~60 frames per second during playback
+SLIDE_DURATION = 0.15  # seconds per animated tile slide
+MIN_GRID_SIZE, MAX_GRID_SIZE = 3, 10
+
+def moved_tile(before: PuzzleState, after: PuzzleState) -> Tuple[int, Tuple[int, int], Tuple[int, int]]:
+    """Returns (tile, source, destination) for the single slide between two states."""
+    row, col = after.blank_position
+    return before.state[row][col], (row, col), before.blank_position
+
+def default_heuristic() -> str:
+    # Use the pattern database when one has been built.
+    return "pdb" if DEFAULT_PDB_PATH.exists() else "walking_distance"
+
+class SolveJob:
+    """Solves one board on a background thread.
+
+    The search checks a cancel event at its checkpoints and pushes progress
+    (nodes expanded, f-bound, elapsed seconds) into a queue that the Tk thread
+    drains from ``root.after`` callbacks; Tk itself is never touched here.
+    """
+
+    def __init__(self, state: PuzzleState, cache: Optional[SolutionCache] = None):
+        self.board = state.to_packed()
+        self.size = state.size
+        self.cancel_event = threading.Event()
+        self.progress: "queue.Queue[Tuple[int, int, float]]" = queue.Queue()
+        # IDA* keeps memory flat. Other board sizes are out of reach for
+        # optimal search, so solve them in stages.
+        engine = "ida" if state.size == SIZE else "staged"
+        self.solver = PuzzleSolver(PuzzleState.from_packed(self.board, state.size), engine=engine,
+                                   heuristic=default_heuristic(), cache=cache, cancel_event=self.cancel_event,
+                                   on_progress=self._report)
+        self.solution_steps: Optional[List[PuzzleState]] = None
+        self.error: Optional[Exception] = None
+        self.elapsed_time = 0.0
+        self._last_report = 0.0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _report(self, nodes: int, bound: int, elapsed: float):
+        if elapsed - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = elapsed
+            self.progress.put((nodes, bound, elapsed))
+
+    def _run(self):
+        start_time = time.time()
+        try:
+            self.solution_steps = self.solver.get_solution_states()
+        except Exception as e:  # reported on the Tk thread
+            self.error = e
+        self.elapsed_time = time.time() - start_time
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_done(self) -> bool:
+        return not self._thread.is_alive()
+
+class HintJob:
+    """Finds the optimal next move for one 4x4 board on a background thread.
+
+    Boards on or next to a known plan are answered at once; a new move by the
+    player cancels the job for the board it left.
+    """
+
+    def __init__(self, engine: HintEngine, state: PuzzleState, show_move: bool):
+        self.board = state.to_packed()
+        self.engine = engine
+        self.show_move = show_move  # the player asked for the move, not just the count
+        self.cancel_event = threading.Event()
+        self.hint: Optional[Hint] = None
+        self.error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        try:
+            self.hint = self.engine.hint(self.board, self.cancel_event)
+        except Exception as e:  # reported on the Tk thread
+            self.error = e
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_done(self) -> bool:
+        return not self._thread.is_alive()
 
 class GameInterface:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("15-Puzzle Game")
         
-        self.image_handler = ImageHandler()
+        self.image_handler = ImageHandler(tile_cache=TileCache())
+        self.image_path: Optional[str] = None
         self.current_state = None
         self.solution_steps = None
         self.current_step = 0
+        self.solve_job: Optional[SolveJob] = None
+        self.awaiting_solution = False
+        # Plans are shared between solves and hints, so a solved board's hints are lookups.
+        self.hint_engine = HintEngine(default_heuristic())
+        self.hint_job: Optional[HintJob] = None
+        # Canvas rendering: one PhotoImage and canvas item per tile, moved in place.
+        self.tile_photos: List[ImageTk.PhotoImage] = []
+        self.tile_items: dict = {}
+        self.displayed: List[int] = []
+        self.playing = False
+        self.slide_start = 0.0
         
         self._setup_ui()
 
@@ -39,12 +151,33 @@ class GameInterface:
         self.solve_btn = tk.Button(self.button_frame, text="Solve", command=self._solve_puzzle)
         self.solve_btn.pack(side='left', padx=5)
 
+        self.cancel_btn = tk.Button(self.button_frame, text="Cancel", command=self._cancel_solve)
+        self.cancel_btn.pack(side='left', padx=5)
+        self.cancel_btn.config(state='disabled')
+
         self.next_btn = tk.Button(self.button_frame, text="Next Move", command=self._next_move)
         self.next_btn.pack(side='left', padx=5)
         self.next_btn.config(state='disabled')
 
-        self.canvas = tk.Canvas(self.main_frame, width=300, height=300)
+        self.play_btn = tk.Button(self.button_frame, text="Play", command=self._toggle_play)
+        self.play_btn.pack(side='left', padx=5)
+        self.play_btn.config(state='disabled')
+
+        self.hint_btn = tk.Button(self.button_frame, text="Hint", command=self._show_hint)
+        self.hint_btn.pack(side='left', padx=5)
+
+        tk.Label(self.button_frame, text="Size").pack(side='left', padx=(10, 0))
+        self.size_var = tk.IntVar(value=SIZE)
+        self.size_spin = tk.Spinbox(self.button_frame, from_=MIN_GRID_SIZE, to=MAX_GRID_SIZE, width=3, textvariable=self.size_var,
+                                    command=self._change_size)
+        self.size_spin.pack(side='left', padx=5)
+        # command= only fires for the arrows; typed sizes apply on Enter or when focus leaves.
+        self.size_spin.bind('<Return>', lambda event: self._change_size())
+        self.size_spin.bind('<FocusOut>', lambda event: self._change_size())
+
+        self.canvas = tk.Canvas(self.main_frame, width=300, height=300, background='white', highlightthickness=0)
         self.canvas.pack(expand=True)
+        self.canvas.bind('<Button-1>', self._on_click)
 
         self.status_var = tk.StringVar()
         self.status_var.set("Load an image to start")
@@ -57,62 +190,271 @@ class GameInterface:
         )
         if file_path:
             if self.image_handler.load_image(file_path):
+                self.image_path = file_path
+                self._stop_solve_job()
                 self.image_handler.split_image()
-                self.current_state = PuzzleState()
+                self._create_tile_items()
+                self.current_state = PuzzleState(size=self.image_handler.grid_size)
                 self._update_display()
                 self.status_var.set("Image loaded. Click 'Shuffle' to start")
             else:
                 messagebox.showerror("Error", "Failed to load image")
 
+    def _change_size(self):
+        """Re-splits the loaded image for the selected grid size."""
+        try:
+            size = min(max(self.size_var.get(), MIN_GRID_SIZE), MAX_GRID_SIZE)
+        except tk.TclError:  # not a number
+            size = self.image_handler.grid_size
+        self.size_var.set(size)
+        if size == self.image_handler.grid_size:
+            return
+        self._stop_solve_job()
+        self.image_handler.grid_size = size
+        self.solution_steps = None
+        self.next_btn.config(state='disabled')
+        self.play_btn.config(state='disabled')
+        if self.image_path and self.image_handler.load_image(self.image_path):
+            self.image_handler.split_image()
+            self._create_tile_items()
+            self.current_state = PuzzleState(size=self.image_handler.grid_size)
+            self._update_display()
+            self.status_var.set("Grid size changed. Click 'Shuffle' to start")
+
     def _shuffle_puzzle(self):
         if self.image_handler.tiles:
-            self.current_state = PuzzleState.create_random_state()
+            self._stop_solve_job()
+            self.current_state = PuzzleState.create_random_state(self.image_handler.grid_size)
             self._update_display()
             self.solution_steps = None
             self.current_step = 0
             self.next_btn.config(state='disabled')
+            self.play_btn.config(state='disabled')
             self.status_var.set("Puzzle shuffled. Click 'Solve' to find solution")
+            # Speculatively start solving so the answer may be ready when asked for.
+            self.solve_job = SolveJob(self.current_state, self.hint_engine.cache)
+            self.solve_job.start()
 
     def _solve_puzzle(self):
         if self.current_state:
-            solver = PuzzleSolver(self.current_state)
-            start_time = time.time()
-            self.solution_steps = solver.get_solution_states()
-            elapsed_time = time.time() - start_time
-            
-            if self.solution_steps:
-                self.current_step = 0
-                self.next_btn.config(state='normal')
-                self.status_var.set(f"Solution found in {elapsed_time:.2f} seconds! {len(self.solution_steps)-1} moves")
+            job = self.solve_job
+            if job is None or (job.board, job.size) != (self.current_state.to_packed(), self.current_state.size):
+                self._stop_solve_job()
+                self.solve_job = SolveJob(self.current_state, self.hint_engine.cache)
+                self.solve_job.start()
+
+            self.awaiting_solution = True
+            self.solve_btn.config(state='disabled')
+            self.cancel_btn.config(state='normal')
+            self.status_var.set("Solving...")
+            self._poll_solve()
+
+    def _poll_solve(self):
+        """Runs on the Tk thread: shows progress until the worker finishes."""
+        job = self.solve_job
+        if job is None or not self.awaiting_solution:
+            return
+
+        progress = None
+        while not job.progress.empty():
+            progress = job.progress.get_nowait()
+
+        if job.is_done():
+            self._finish_solve(job)
+        else:
+            if progress:
+                nodes, bound, elapsed = progress
+                self.status_var.set(f"Solving... {nodes:,} nodes expanded, f-bound {bound}, {elapsed:.1f}s")
+            self.root.after(POLL_INTERVAL_MS, self._poll_solve)
+
+    def _finish_solve(self, job: SolveJob):
+        self.awaiting_solution = False
+        self.solve_btn.config(state='normal')
+        self.cancel_btn.config(state='disabled')
+
+        if isinstance(job.error, SearchCancelled):
+            self.solve_job = None
+            self.status_var.set("Solving cancelled")
+        elif job.error is not None:
+            self.solve_job = None
+            messagebox.showerror("Error", str(job.error))
+        elif job.solution_steps:
+            self.solution_steps = job.solution_steps
+            self.current_step = 0
+            self.next_btn.config(state='normal')
+            self.play_btn.config(state='normal')
+            self.status_var.set(f"Solution found in {job.elapsed_time:.2f} seconds! {len(self.solution_steps)-1} moves")
+        else:
+            messagebox.showerror("Error", "No solution found")
+
+    def _cancel_solve(self):
+        if self.solve_job is not None:
+            self.solve_job.cancel()
+            self.status_var.set("Cancelling...")
+
+    def _stop_solve_job(self):
+        """Cancels any running or speculative solve for the current board."""
+        self._stop_playback()
+        self._stop_hint_job()
+        if self.solve_job is not None:
+            self.solve_job.cancel()
+            self.solve_job = None
+        if self.awaiting_solution:
+            self.awaiting_solution = False
+            self.solve_btn.config(state='normal')
+            self.cancel_btn.config(state='disabled')
+
+    def _on_click(self, event):
+        """Slides the clicked tile if it is next to the blank."""
+        if not self.current_state or not self.tile_items or self.playing or self.awaiting_solution:
+            return
+        tile_width, tile_height = self.image_handler.tile_size
+        position = (event.y // tile_height, event.x // tile_width)
+        following = PuzzleState([row[:] for row in self.current_state.state])
+        if not following.move(position):
+            return
+
+        # Stay on the solution if the player made its next move; otherwise it no longer applies.
+        steps = self.solution_steps
+        if steps and self.current_step < len(steps) - 1 and steps[self.current_step + 1] == following:
+            self.current_step += 1
+        else:
+            self.solution_steps = None
+            self.next_btn.config(state='disabled')
+            self.play_btn.config(state='disabled')
+        self.current_state = following
+        self._update_display()
+        if self.current_state.is_goal_state():
+            self._stop_hint_job()
+            self.status_var.set("Puzzle solved!")
+        else:
+            self._start_hint_job(show_move=False)
+
+    def _show_hint(self):
+        if self.current_state and not self.current_state.is_goal_state():
+            self._start_hint_job(show_move=True)
+
+    def _start_hint_job(self, show_move: bool):
+        self._stop_hint_job()
+        if self.current_state.size != SIZE:
+            if show_move:
+                self.status_var.set(f"Hints are available for {SIZE}x{SIZE} boards only")
+            return
+        self.hint_job = HintJob(self.hint_engine, self.current_state, show_move)
+        self.hint_job.start()
+        self._poll_hint(self.hint_job)
+
+    def _stop_hint_job(self):
+        if self.hint_job is not None:
+            self.hint_job.cancel()
+            self.hint_job = None
+
+    def _poll_hint(self, job: HintJob):
+        """Runs on the Tk thread: shows the hint, or the moves remaining, once it is known."""
+        if job is not self.hint_job:  # replaced by a newer job
+            return
+        if not job.is_done():
+            self.status_var.set("Thinking...")
+            self.root.after(POLL_INTERVAL_MS, self._poll_hint, job)
+            return
+
+        self.hint_job = None
+        if isinstance(job.error, SearchCancelled):
+            return
+        if job.error is not None:
+            messagebox.showerror("Error", str(job.error))
+        elif job.hint is not None:
+            row, col = job.hint.move
+            if job.show_move:
+                self.status_var.set(f"Hint: slide tile {self.current_state.state[row][col]} "
+                                    f"({job.hint.remaining} moves remaining)")
             else:
-                messagebox.showerror("Error", "No solution found")
+                self.status_var.set(f"{job.hint.remaining} moves remaining")
 
     def _next_move(self):
         if self.solution_steps and self.current_step < len(self.solution_steps) - 1:
             self.current_step += 1
             self.current_state = self.solution_steps[self.current_step]
             self._update_display()
-            
+            self._show_step()
+
+    def _show_step(self):
+        if self.current_step == len(self.solution_steps) - 1:
+            self.next_btn.config(state='disabled')
+            self.play_btn.config(state='disabled')
+            self.status_var.set("Puzzle solved!")
+        else:
+            self.status_var.set(f"Move {self.current_step} of {len(self.solution_steps)-1}")
+
+    def _toggle_play(self):
+        if self.playing:
+            self._stop_playback()
+        elif self.solution_steps and self.current_step < len(self.solution_steps) - 1:
+            self.playing = True
+            self.play_btn.config(text="Pause")
+            self.next_btn.config(state='disabled')
+            self.slide_start = time.perf_counter()
+            self._animate()
+
+    def _stop_playback(self):
+        if self.playing:
+            self.playing = False
+            self.play_btn.config(text="Play")
+            # A slide cut short snaps back to the current step's layout; forget
+            # what is displayed so the half-moved tile is placed again too.
+            self.displayed = []
+            self._update_display()
+            if self.solution_steps and self.current_step < len(self.solution_steps) - 1:
+                self.next_btn.config(state='normal')
+
+    def _animate(self):
+        """Runs on the Tk thread: slides one tile per step, timed by the clock so
+        playback keeps a steady pace even when frames arrive late."""
+        if not self.playing:
+            return
+        following = self.solution_steps[self.current_step + 1]
+        tile, source, destination = moved_tile(self.current_state, following)
+        fraction = min(1.0, (time.perf_counter() - self.slide_start) / SLIDE_DURATION)
+        (x0, y0), (x1, y1) = self._cell_origin(*source), self._cell_origin(*destination)
+        self.canvas.coords(self.tile_items[tile], x0 + (x1 - x0) * fraction, y0 + (y1 - y0) * fraction)
+
+        if fraction >= 1.0:
+            self.current_step += 1
+            self.current_state = following
+            self._update_display()
+            self._show_step()
             if self.current_step == len(self.solution_steps) - 1:
-                self.next_btn.config(state='disabled')
-                self.status_var.set("Puzzle solved!")
-            else:
-                self.status_var.set(f"Move {self.current_step} of {len(self.solution_steps)-1}")
+                self.playing = False
+                self.play_btn.config(text="Play")
+                return
+            self.slide_start = time.perf_counter()
+        self.root.after(FRAME_INTERVAL_MS, self._animate)
+
+    def _cell_origin(self, row: int, col: int) -> Tuple[int, int]:
+        tile_width, tile_height = self.image_handler.tile_size
+        return col * tile_width, row * tile_height
+
+    def _create_tile_items(self):
+        """Converts every tile to a PhotoImage once and gives it a canvas item."""
+        self.canvas.delete("all")
+        self.tile_photos = [ImageTk.PhotoImage(Image.fromarray(cv2.cvtColor(tile, cv2.COLOR_BGR2RGB)))
+                            for tile in self.image_handler.tiles]
+        # The blank (tile 0) has no item; the white canvas background shows through.
+        self.tile_items = {number: self.canvas.create_image(0, 0, anchor='nw', image=photo)
+                           for number, photo in enumerate(self.tile_photos, start=1)}
+        self.displayed = []
 
     def _update_display(self):
-        if not self.current_state or not self.image_handler.tiles:
+        """Moves only the canvas items whose tile changed cell since the last call."""
+        if not self.current_state or not self.tile_items:
             return
 
         flat_state = [num for row in self.current_state.state for num in row]
-        merged = self.image_handler.merge_tiles(flat_state)
-        
-        image = cv2.cvtColor(merged, cv2.COLOR_BGR2RGB)
-        image = Image.fromarray(image)
-        photo = ImageTk.PhotoImage(image)
-        
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor='nw', image=photo)
-        self.canvas.image = photo
+        n = self.current_state.size
+        for index, tile in enumerate(flat_state):
+            if tile and (len(self.displayed) != len(flat_state) or self.displayed[index] != tile):
+                self.canvas.coords(self.tile_items[tile], *self._cell_origin(*divmod(index, n)))
+        self.displayed = flat_state
 
     def run(self):
         self.root.mainloop()
\ No newline at end of file
@@ -0,0 +1,60 @@
+import cv2
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+from src.image_processing.animation import export_animation
+from src.image_processing.image_handler import ImageHandler
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.solver import PuzzleSolver
+
+@pytest.fixture
+def handler(tmp_path):
+    image = np.zeros((120, 120, 3), dtype=np.uint8)
+    image[:, :, 0] = np.arange(120)[None, :] * 2
+    image[:, :, 1] = np.arange(120)[:, None] * 2
+    path = tmp_path / "image.png"
+    cv2.imwrite(str(path), image)
+    handler = ImageHandler()
+    assert handler.load_image(str(path), target_size=(120, 120))
+    handler.split_image()
+    return handler
+
+def solution_states():
+    puzzle = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    return PuzzleSolver(puzzle).get_solution_states()
+
+def test_merge_tiles_matches_tile_layout(handler):
+    order = [0] + list(range(2, 16)) + [1]
+    merged = handler.merge_tiles(order)
+    assert (merged[:30, :30] == 255).all()
+    assert (merged[:30, 30:60] == handler.tiles[1]).all()
+    assert (merged[90:, 90:] == handler.tiles[0]).all()
+    assert handler.merge_tiles(list(range(1, 16)) + [0]) is merged  # buffer is reused
+    with pytest.raises(ValueError):
+        handler.merge_tiles([17] * 16)
+
+def test_export_gif_streams_frames(handler, tmp_path):
+    states = solution_states()
+    path = tmp_path / "solution.gif"
+    assert export_animation(handler, iter(states), path) == len(states)
+
+    frames = list(ImageSequence.Iterator(Image.open(path)))
+    assert len(frames) == len(states)
+    last = np.asarray(frames[-1].convert("RGB")).astype(int)
+    expected = cv2.cvtColor(handler.merge_tiles(list(range(1, 16)) + [0]), cv2.COLOR_BGR2RGB).astype(int)
+    assert np.abs(last - expected).max() <= 16  # palette quantization
+
+def test_export_video(handler, tmp_path):
+    path = tmp_path / "solution.mp4"
+    assert export_animation(handler, solution_states(), path) == 10
+    assert cv2.VideoCapture(str(path)).get(cv2.CAP_PROP_FRAME_COUNT) == 10
+
+def test_export_rejects_unknown_format(handler, tmp_path):
+    with pytest.raises(ValueError, match="Unsupported"):
+        export_animation(handler, solution_states(), tmp_path / "solution.webm")
+
+def test_export_rejects_empty_input(handler, tmp_path):
+    for name in ("empty.gif", "empty.mp4"):
+        with pytest.raises(ValueError, match="No states"):
+            export_animation(handler, iter([]), tmp_path / name)
+        assert not (tmp_path / name).exists()
@@ -0,0 +1,40 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.puzzle import batch
+from src.puzzle.batch import INVALID, LIMIT_EXCEEDED, SOLVED, UNSOLVABLE, solve_board, solve_many
+from src.puzzle.puzzle_state import PuzzleState
+
+BOARDS = [
+    PuzzleState(),
+    PuzzleState([[1, 2, 3, 4], [5, 6, 0, 8], [9, 10, 7, 12], [13, 14, 11, 15]]),
+    PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]]).to_packed(),
+    PuzzleState([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 15, 14, 0]]),
+]
+
+def test_solve_many_reports_every_board():
+    results = sorted(solve_many(BOARDS, workers=2), key=lambda result: result.index)
+    assert [result.status for result in results] == [SOLVED, SOLVED, SOLVED, UNSOLVABLE]
+    assert [result.length for result in results[:3]] == [0, 3, 9]
+
+def test_solve_many_node_limit():
+    hard = PuzzleState([[15, 14, 13, 12], [11, 10, 9, 8], [7, 6, 5, 4], [3, 1, 2, 0]])
+    (result,) = solve_many([hard], workers=1, node_limit=1000)
+    assert result.status == LIMIT_EXCEEDED
+    assert result.moves is None
+
+def test_boards_the_engine_cannot_take_are_invalid():
+    small = PuzzleState([[1, 2, 3], [4, 0, 6], [7, 5, 8]])
+    results = sorted(solve_many([small, BOARDS[1]], engine="ida", workers=1), key=lambda result: result.index)
+    assert [result.status for result in results] == [INVALID, SOLVED]
+    assert "engine" in results[0].error
+    assert solve_board(0, small.to_packed(), 3, engine="staged").status == SOLVED
+
+def test_spawned_workers_rebuild_walking_distance_tables(monkeypatch):
+    # spawn (and forkserver) workers start from a fresh import, not a copy of the parent.
+    spawn = multiprocessing.get_context("spawn")
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", partial(ProcessPoolExecutor, mp_context=spawn))
+    results = sorted(solve_many(BOARDS[:3], heuristic="walking_distance", workers=1),
+                     key=lambda result: result.index)
+    assert [result.length for result in results] == [0, 3, 9]
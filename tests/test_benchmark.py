@@ -0,0 +1,35 @@
+import json
+
+from src.benchmark import load_boards, main, random_walk_boards
+from src.puzzle.board import GOAL
+from src.puzzle.puzzle_state import PuzzleState
+
+def test_random_walks_are_reproducible():
+    assert random_walk_boards(3, 20, seed=7) == random_walk_boards(3, 20, seed=7)
+
+def test_load_korf_format(tmp_path):
+    path = tmp_path / "korf.txt"
+    path.write_text("# index then board\n1 0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15\n"
+                    "2 1 0 2 3 4 5 6 7 8 9 10 11 12 13 14 15\n")
+    goal, one_move = load_boards(path)
+    assert goal == GOAL
+    assert PuzzleState.from_packed(one_move).state[3] == [13, 14, 0, 15]
+
+def test_benchmark_writes_json(tmp_path):
+    output = tmp_path / "bench.json"
+    main(["--instances", "walk:12", "--count", "2", "--profile", "--output", str(output)])
+    report = json.loads(output.read_text())
+    assert report["summary"]["solved"] == 2
+    result = report["results"][0]
+    assert result["heuristic_time"] is not None
+    assert result["nodes_expanded"] <= result["nodes_generated"] + 1
+
+def test_unsolvable_boards_are_reported(tmp_path):
+    boards = tmp_path / "boards.txt"
+    boards.write_text("0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15\n"
+                      "0 2 1 3 4 5 6 7 8 9 10 11 12 13 14 15\n")
+    output = tmp_path / "bench.json"
+    main(["--instances", str(boards), "--output", str(output)])
+    report = json.loads(output.read_text())
+    assert [result["status"] for result in report["results"]] == ["solved", "unsolvable"]
+    assert report["summary"]["solved"] == 1
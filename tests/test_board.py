@@ -0,0 +1,26 @@
+from src.puzzle.board import GOAL, NEIGHBORS, find_blank, pack, slide, unpack
+from src.puzzle.puzzle_state import PuzzleState
+
+def test_pack_roundtrip():
+    tiles = [5, 1, 2, 3, 0, 6, 7, 4, 9, 10, 11, 8, 13, 14, 15, 12]
+    assert unpack(pack(tiles)) == tiles
+    assert pack(list(range(1, 16)) + [0]) == GOAL
+
+def test_slide_matches_puzzle_state_move():
+    puzzle = PuzzleState()
+    board = puzzle.to_packed()
+    blank = find_blank(board)
+    assert blank == 15
+    assert NEIGHBORS[blank] == (14, 11)
+
+    board = slide(board, blank, 11)
+    puzzle.move((2, 3))
+    assert board == puzzle.to_packed()
+    assert find_blank(board) == 11
+
+def test_puzzle_state_packed_conversion():
+    puzzle = PuzzleState([[1, 2, 3, 4], [5, 6, 0, 8], [9, 10, 7, 12], [13, 14, 11, 15]])
+    restored = PuzzleState.from_packed(puzzle.to_packed())
+    assert restored == puzzle
+    assert restored.blank_position == (1, 2)
+    assert hash(restored) == hash(puzzle)
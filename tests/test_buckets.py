@@ -0,0 +1,22 @@
+import pytest
+from src.puzzle.buckets import BucketQueue
+
+def test_bucket_queue_orders_by_f_then_deepest_g():
+    queue = BucketQueue()
+    queue.push(5, 1, "shallow")
+    queue.push(5, 3, "deep")
+    queue.push(4, 0, "best")
+    queue.push(5, 3, "deep-last")
+    assert len(queue) == 4
+    assert [queue.pop()[2] for _ in range(4)] == ["best", "deep-last", "deep", "shallow"]
+    with pytest.raises(IndexError):
+        queue.pop()
+
+def test_bucket_queue_accepts_lower_f_after_pops():
+    queue = BucketQueue()
+    queue.push(7, 2, "a")
+    assert queue.pop() == (7, 2, "a")
+    queue.push(6, 1, "b")
+    queue.push(9, 4, "c")
+    assert queue.pop() == (6, 1, "b")
+    assert queue.pop() == (9, 4, "c")
@@ -0,0 +1,45 @@
+from src.puzzle.board import GOAL
+from src.puzzle.cache import SolutionCache, canonical, reflect
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.solver import PuzzleSolver
+
+PUZZLE = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+
+def test_reflection_is_an_involution_fixing_the_goal():
+    board = PUZZLE.to_packed()
+    assert reflect(reflect(board)) == board
+    assert reflect(GOAL) == GOAL
+    assert canonical(board)[0] == canonical(reflect(board))[0]
+
+def test_cache_hit_for_mirror_and_path_boards(tmp_path):
+    cache = SolutionCache(tmp_path / "solutions.sqlite")
+    moves = PuzzleSolver(PUZZLE, cache=cache).solve()
+    assert cache.misses == 1
+
+    # Mirrored board: the cached solution is mirrored back.
+    mirrored = PuzzleState.from_packed(reflect(PUZZLE.to_packed()))
+    mirrored_moves = PuzzleSolver(mirrored, cache=cache).solve()
+    assert mirrored_moves == [(col, row) for row, col in moves]
+
+    # A board halfway along the stored path.
+    halfway = PuzzleState.from_packed(PUZZLE.to_packed())
+    for move in moves[:4]:
+        halfway.move(move)
+    assert PuzzleSolver(halfway, cache=cache).solve() == moves[4:]
+    assert cache.hits == 2
+
+def test_cache_persists_on_disk(tmp_path):
+    path = tmp_path / "solutions.sqlite"
+    cache = SolutionCache(path)
+    moves = PuzzleSolver(PUZZLE, cache=cache).solve()
+    cache.close()
+
+    reopened = SolutionCache(path)
+    assert PuzzleSolver(PUZZLE, cache=reopened).solve() == moves
+    assert reopened.hits == 1
+
+def test_memory_only_cache_evicts():
+    cache = SolutionCache(max_entries=3)
+    PuzzleSolver(PUZZLE, cache=cache).solve()
+    assert len(cache.memory) == 3
+    assert cache.get(PUZZLE.to_packed()) is None
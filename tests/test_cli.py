@@ -0,0 +1,44 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+from src.cli import main, parse_board
+
+def test_parse_board():
+    assert parse_board("  # comment") is None
+    assert parse_board("1,2,3,4,0,6,7,5,8").size == 3
+    with pytest.raises(ValueError, match="Invalid board"):
+        parse_board("1 2 3")
+    with pytest.raises(ValueError, match="Invalid board"):
+        parse_board("1 2 x 0")
+
+def test_cli_writes_json_lines(tmp_path, capsys):
+    path = tmp_path / "boards.txt"
+    path.write_text("5 1 2 3 9 6 7 4 13 10 11 8 0 14 15 12\n\n1 2 3 4 5 6 7 8 9 10 11 12 13 15 14 0\n")
+    assert main([str(path), "--engine", "ida", "--heuristic", "linear_conflict"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["status"] for record in records] == ["solved", "unsolvable"]
+    assert records[0]["length"] == 9 and records[0]["moves"] == "UUURRRDDD"
+    assert records[0]["stats"]["heuristic"] == "linear_conflict"
+
+def test_cli_reads_stdin(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("1 2 3 4 0 6 7 5 8\n"))
+    main(["--engine", "staged"])
+    record = json.loads(capsys.readouterr().out)
+    assert record["board"] == [1, 2, 3, 4, 0, 6, 7, 5, 8] and record["moves"] == "DR"
+
+def test_cli_does_not_import_gui_libraries():
+    code = "import sys, src.cli; print(sorted({'tkinter', 'cv2', 'PIL', 'numpy'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+def test_cli_reports_bad_lines_and_keeps_going(monkeypatch, capsys):
+    lines = "1 2 3 4 0 6 7 5 8\n1 2 x\n1 2 3 4 5 6 7 8 9 10 11 12 13 14 0 15\n"
+    monkeypatch.setattr(sys, "stdin", io.StringIO(lines))
+    assert main(["--engine", "ida"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(record["index"], record["status"]) for record in records] == [(0, "invalid"), (1, "invalid"), (2, "solved")]
+    assert records[1]["board"] is None and "Invalid board" in records[1]["error"]
+    assert records[2]["moves"] == "R" and records[2]["error"] is None
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from src.benchmark import random_walk_boards, run
+from src.puzzle.difficulty import DifficultyModel, estimate, estimate_many, heuristic_terms
+from src.puzzle.generator import generate_boards, pack_boards
+from src.puzzle.heuristics import LinearConflictHeuristic, ManhattanHeuristic
+from src.puzzle.puzzle_state import PuzzleState
+
+def test_heuristic_terms_match_the_scalar_heuristics():
+    boards = generate_boards(200, seed=1)
+    distance, conflicts = heuristic_terms(boards)
+    for board, d, c in zip(pack_boards(boards), distance, conflicts):
+        assert ManhattanHeuristic().evaluate(int(board)) == d
+        assert LinearConflictHeuristic().evaluate(int(board)) == d + c
+
+def test_packed_and_tile_arrays_agree():
+    boards = generate_boards(50, seed=2)
+    for expected, actual in zip(estimate_many(boards), estimate_many(pack_boards(boards))):
+        assert np.array_equal(expected, actual)
+
+def test_estimate_single_board():
+    puzzle = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    result = estimate(puzzle)
+    assert result.lower_bound <= 9
+    assert result.nodes > 0 and result.seconds > 0
+    assert estimate(PuzzleState()).lower_bound == 0
+
+def test_harder_boards_are_predicted_harder():
+    easy, hard = estimate_many(generate_boards(100, depth=10, seed=3)), estimate_many(generate_boards(100, seed=3))
+    assert np.median(hard[1]) > 100 * np.median(easy[1])
+
+def test_unknown_heuristic_and_sizes_are_rejected():
+    with pytest.raises(ValueError, match="No difficulty model"):
+        estimate(PuzzleState(), heuristic="pdb")
+    with pytest.raises(ValueError):
+        estimate(PuzzleState(size=3))
+
+def test_model_fits_a_benchmark_report():
+    results = run(random_walk_boards(8, 30, seed=5), "ida", "manhattan")
+    model = DifficultyModel.from_report({"results": results})
+    assert model.per_move > 0 and model.nodes_per_second > 0
+    lower_bounds, nodes, _ = estimate_many(generate_boards(10, depth=30, seed=5), model=model)
+    assert np.all(nodes > 0)
+
+def test_censored_fit_accounts_for_cut_off_boards():
+    boards = generate_boards(400, depth=(10, 60), seed=6)
+    distance, conflicts = heuristic_terms(boards)
+    true = DifficultyModel(0.5, 0.35, 0.6, 1e5)
+    nodes = true.predict(distance, conflicts) * np.exp(np.random.default_rng(6).normal(0, 0.5, len(boards)))
+    limit = np.median(nodes)
+    censored = nodes > limit
+    seen = np.minimum(nodes, limit)
+    tobit = DifficultyModel.fit(boards, seen, np.ones(len(boards)), censored)
+    plain = DifficultyModel.fit(boards, seen, np.ones(len(boards)))
+    assert abs(tobit.per_move - true.per_move) < 0.05 and abs(tobit.per_conflict - true.per_conflict) < 0.1
+    assert plain.per_move < tobit.per_move  # treating cut-off boards as solved pulls the slope down
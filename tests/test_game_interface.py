@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+pytest.importorskip("tkinter")
+from src.puzzle.limits import SearchCancelled
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.hints import HintEngine
+from src.ui.game_interface import HintJob, SolveJob, moved_tile
+
+def wait_for(job, timeout=10.0):
+    deadline = time.time() + timeout
+    while not job.is_done() and time.time() < deadline:
+        time.sleep(0.01)
+    assert job.is_done()
+
+def test_solve_job_runs_in_background():
+    job = SolveJob(PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]]))
+    job.start()
+    wait_for(job)
+    assert job.error is None
+    assert len(job.solution_steps) == 10
+    assert job.solution_steps[-1].is_goal_state()
+
+def test_solve_job_can_be_cancelled():
+    job = SolveJob(PuzzleState([[15, 14, 13, 12], [11, 10, 9, 8], [7, 6, 5, 4], [3, 1, 2, 0]]))
+    job.start()
+    job.cancel()
+    wait_for(job)
+    assert isinstance(job.error, SearchCancelled)
+
+def test_moved_tile():
+    before = PuzzleState([[1, 2, 3], [4, 0, 6], [7, 5, 8]])
+    after = PuzzleState([[1, 2, 3], [4, 5, 6], [7, 0, 8]])
+    assert moved_tile(before, after) == (5, (2, 1), (1, 1))
+
+def test_solve_job_uses_staged_engine_for_other_sizes():
+    job = SolveJob(PuzzleState([[1, 2, 3], [4, 0, 6], [7, 5, 8]]))
+    job.start()
+    wait_for(job)
+    assert job.solver.engine == "staged"
+    assert len(job.solution_steps) == 3
+
+def test_hint_job_reuses_the_solve_plan():
+    state = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    engine = HintEngine("manhattan")
+    solve = SolveJob(state, engine.cache)
+    solve.start()
+    wait_for(solve)
+    job = HintJob(engine, solve.solution_steps[1], show_move=True)
+    job.start()
+    wait_for(job)
+    assert job.error is None
+    assert job.hint.remaining == 8
+
+class FakeCanvas:
+    def __init__(self):
+        self.positions = {}
+
+    def coords(self, item, x, y):
+        self.positions[item] = (x, y)
+
+class FakeWidget:
+    def config(self, **options):
+        pass
+
+def test_pausing_mid_slide_puts_the_tile_back():
+    from types import SimpleNamespace
+    from src.ui.game_interface import GameInterface
+
+    before = PuzzleState([[1, 2, 3], [4, 0, 6], [7, 5, 8]])
+    after = PuzzleState([[1, 2, 3], [4, 5, 6], [7, 0, 8]])
+    interface = GameInterface.__new__(GameInterface)
+    interface.canvas = FakeCanvas()
+    interface.play_btn = interface.next_btn = FakeWidget()
+    interface.image_handler = SimpleNamespace(tile_size=(10, 10))
+    interface.tile_items = {number: number for number in range(1, 9)}
+    interface.solution_steps = [before, after]
+    interface.current_step = 0
+    interface.current_state = before
+    interface.displayed = []
+    interface._update_display()
+
+    interface.canvas.coords(interface.tile_items[5], 10, 15)  # halfway up
+    interface.playing = True
+    interface._stop_playback()
+    assert interface.canvas.positions[interface.tile_items[5]] == (10, 20)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from src.puzzle.board import pack
+from src.puzzle.generator import generate_boards, is_solvable, manhattan, pack_boards, unpack_boards, write_boards
+from src.puzzle.puzzle_state import PuzzleState
+
+def as_state(row, size=4):
+    tiles = [int(tile) for tile in row]
+    return PuzzleState([tiles[i:i + size] for i in range(0, size * size, size)])
+
+@pytest.mark.parametrize("size", [3, 4, 5])
+def test_uniform_boards_are_solvable_permutations(size):
+    boards = generate_boards(500, size, seed=0)
+    assert boards.dtype == np.uint8 and boards.shape == (500, size * size)
+    assert (np.sort(boards, axis=1) == np.arange(size * size)).all()
+    assert all(as_state(row, size).is_solvable() for row in boards)
+
+def test_is_solvable_matches_puzzle_state():
+    boards = np.random.default_rng(1).permuted(np.tile(np.arange(16, dtype=np.uint8), (300, 1)), axis=1)
+    assert list(is_solvable(boards)) == [as_state(row).is_solvable() for row in boards]
+
+def test_scrambled_boards_respect_depth():
+    boards = generate_boards(300, depth=(3, 5), seed=2)
+    assert all(as_state(row).is_solvable() for row in boards)
+    assert manhattan(boards).max() <= 5
+    assert (generate_boards(10, depth=0) == generate_boards(1, depth=0)[0]).all()
+
+def test_lower_bound_range_and_reproducibility():
+    boards = generate_boards(200, lower_bound=(30, 32), seed=3)
+    distances = manhattan(boards)
+    assert distances.min() >= 30 and distances.max() <= 32
+    assert (generate_boards(200, lower_bound=(30, 32), seed=3) == boards).all()
+    assert manhattan(np.array([[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 0, 15]])) == [1]
+
+def test_pack_and_write_boards(tmp_path):
+    boards = generate_boards(20, seed=4)
+    packed = pack_boards(boards)
+    assert int(packed[0]) == pack(int(tile) for tile in boards[0])
+    assert (unpack_boards(packed) == boards).all()
+    write_boards(tmp_path / "boards.npy", boards)
+    assert (np.load(tmp_path / "boards.npy") == boards).all()
+    write_boards(tmp_path / "boards.txt", boards)
+    assert len((tmp_path / "boards.txt").read_text().splitlines()) == 20
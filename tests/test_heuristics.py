@@ -0,0 +1,56 @@
+import random
+
+import pytest
+from src.puzzle.board import GOAL, NEIGHBORS, find_blank, slide, tile_at
+from src.puzzle.heuristics import (LinearConflictHeuristic, ManhattanHeuristic,
+                                   WalkingDistanceHeuristic, get_heuristic)
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.solver import PuzzleSolver
+
+HEURISTICS = [ManhattanHeuristic(), LinearConflictHeuristic(), WalkingDistanceHeuristic()]
+
+def random_walk(steps, seed):
+    rng = random.Random(seed)
+    board, blank = GOAL, find_blank(GOAL)
+    for _ in range(steps):
+        target = rng.choice(NEIGHBORS[blank])
+        board, blank = slide(board, blank, target), target
+    return board, blank
+
+@pytest.mark.parametrize("heuristic", HEURISTICS, ids=lambda h: h.name)
+def test_goal_is_zero(heuristic):
+    assert heuristic.evaluate(GOAL) == 0
+
+@pytest.mark.parametrize("heuristic", HEURISTICS, ids=lambda h: h.name)
+def test_incremental_update_matches_full_evaluation(heuristic):
+    rng = random.Random(2)
+    board, blank = random_walk(40, seed=1)
+    h, context = heuristic.initial(board)
+    for _ in range(200):
+        target = rng.choice(NEIGHBORS[blank])
+        tile = tile_at(board, target)
+        board = slide(board, blank, target)
+        h, context = heuristic.update(context, board, tile, target, blank)
+        blank = target
+        assert h == heuristic.evaluate(board)
+
+def test_dominance_over_manhattan():
+    board, _ = random_walk(60, seed=3)
+    manhattan = ManhattanHeuristic().evaluate(board)
+    assert LinearConflictHeuristic().evaluate(board) >= manhattan
+    assert WalkingDistanceHeuristic().evaluate(board) >= manhattan
+
+def test_linear_conflict_value():
+    # 2 and 1 are swapped in their goal row: Manhattan 2 plus one conflict.
+    puzzle = PuzzleState([[2, 1, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]])
+    assert LinearConflictHeuristic().evaluate(puzzle.to_packed()) == 4
+
+@pytest.mark.parametrize("name", ["linear_conflict", "walking_distance"])
+def test_solver_heuristics_stay_optimal(name):
+    puzzle = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    assert len(PuzzleSolver(puzzle, engine="ida", heuristic=name).solve()) == 9
+    assert len(PuzzleSolver(puzzle, heuristic=name).solve()) == 9
+
+def test_unknown_heuristic():
+    with pytest.raises(ValueError, match="Unknown heuristic"):
+        get_heuristic("hamming")
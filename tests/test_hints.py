@@ -0,0 +1,57 @@
+import pytest
+
+from src.puzzle.board import GOAL, NEIGHBORS, POSITIONS, find_blank, slide
+from src.puzzle.cache import SolutionCache
+from src.puzzle.hints import HintEngine
+from src.puzzle.limits import SearchLimitExceeded
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.solver import PuzzleSolver
+
+START = PuzzleState([[6, 7, 15, 3], [5, 1, 11, 4], [0, 9, 8, 2], [13, 10, 14, 12]])
+
+def optimal_length(board):
+    return len(PuzzleSolver(PuzzleState.from_packed(board), engine="ida", heuristic="walking_distance").solve())
+
+def test_following_hints_solves_optimally():
+    engine = HintEngine()
+    board, blank = START.to_packed(), START.blank_position
+    length = engine.remaining(board)
+    assert length == optimal_length(board) == 30
+    for remaining in range(length, 0, -1):
+        hint = engine.hint(board)
+        assert hint.remaining == remaining
+        board = slide(board, find_blank(board), hint.move[0] * 4 + hint.move[1])
+    assert board == GOAL
+    assert engine.hint(board) is None
+
+def test_hints_next_to_the_plan_stay_optimal():
+    engine = HintEngine()
+    board = START.to_packed()
+    for _ in range(5):
+        hint = engine.hint(board)
+        board = slide(board, find_blank(board), hint.move[0] * 4 + hint.move[1])
+    blank = find_blank(board)
+    for cell in NEIGHBORS[blank]:
+        neighbor = slide(board, blank, cell)
+        assert engine.remaining(neighbor) == optimal_length(neighbor)
+
+def test_solver_plans_are_reused():
+    cache = SolutionCache()
+    cells = [row * 4 + col for row, col in PuzzleSolver(START, cache=cache).solve()]
+    engine = HintEngine(cache=cache)
+    hint = engine.hint(START)
+    assert hint.move == POSITIONS[cells[0]] and hint.remaining == len(cells)
+    assert engine.bounds == {}
+
+def test_interrupted_search_keeps_its_bound():
+    engine = HintEngine("manhattan", time_limit=0.001)
+    with pytest.raises(SearchLimitExceeded):
+        engine.hint(START)
+    assert engine.bounds[START.to_packed()] >= engine.heuristic.evaluate(START.to_packed())
+    engine.time_limit = None
+    assert engine.remaining(START) == 30
+    assert engine.bounds == {}
+
+def test_unsolvable_board():
+    with pytest.raises(ValueError):
+        HintEngine().hint(PuzzleState([[2, 1, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]]))
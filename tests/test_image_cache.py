@@ -0,0 +1,57 @@
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+from src.image_processing.image_handler import ImageHandler, TileCache, read_reduced
+
+@pytest.fixture
+def photo(tmp_path):
+    image = np.zeros((1300, 1700, 3), dtype=np.uint8)
+    image[:, :, 1] = (np.arange(1700)[None, :] * 255 // 1700).astype(np.uint8)
+    image[:, :, 2] = (np.arange(1300)[:, None] * 255 // 1300).astype(np.uint8)
+    path = tmp_path / "photo.jpg"
+    cv2.imwrite(str(path), image)
+    return str(path)
+
+def test_reduced_decoding_still_covers_the_target(photo):
+    assert read_reduced(photo, (300, 300)).shape[:2] == (325, 425)  # 1/4 scale
+    assert read_reduced(photo, (700, 700)).shape[:2] == (1300, 1700)  # too large to reduce
+
+def test_cached_tiles_match_a_fresh_split(photo, tmp_path):
+    cache = TileCache(tmp_path / "tiles")
+    first = ImageHandler(tile_cache=cache)
+    assert first.load_image(photo)
+    first.split_image()
+    assert len(list((tmp_path / "tiles").glob("*.npy"))) == 1
+
+    second = ImageHandler(tile_cache=cache)
+    assert second.load_image(photo)
+    second.split_image()
+    assert np.array_equal(first.tile_stack, second.tile_stack)
+    assert np.array_equal(first.original_image, second.original_image)
+    assert second.tile_size == first.tile_size == (75, 75)
+
+def test_cache_key_depends_on_contents_and_sizes(photo):
+    key = TileCache.key(photo, (300, 300), 4)
+    assert TileCache.key(photo, (300, 300), 3) != key
+    assert TileCache.key(photo, (200, 200), 4) != key
+    with open(photo, "ab") as file:
+        file.write(b"\0")
+    assert TileCache.key(photo, (300, 300), 4) != key
+
+def test_missing_file_fails_to_load(tmp_path):
+    handler = ImageHandler(tile_cache=TileCache(tmp_path / "tiles"))
+    assert not handler.load_image(str(tmp_path / "missing.jpg"))
+
+def test_cache_evicts_least_recently_used_files(tmp_path):
+    stack = np.zeros((17, 10, 10, 3), dtype=np.uint8)
+    cache = TileCache(tmp_path / "tiles", max_bytes=2 * stack.nbytes + 500)
+    cache.put("a", stack)
+    cache.put("b", stack)
+    os.utime(tmp_path / "tiles" / "a.npy", (1, 1))
+    os.utime(tmp_path / "tiles" / "b.npy", (2, 2))
+    assert cache.get("a") is not None  # a hit makes "a" the most recently used
+    cache.put("c", stack)
+    assert sorted(path.stem for path in (tmp_path / "tiles").glob("*.npy")) == ["a", "c"]
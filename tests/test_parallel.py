@@ -0,0 +1,27 @@
+import pytest
+from src.benchmark import random_walk_boards
+from src.puzzle.limits import SearchLimitExceeded
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.solver import PuzzleSolver
+
+def test_parallel_engine_is_optimal():
+    for board in random_walk_boards(3, 40, seed=7):
+        puzzle = PuzzleState.from_packed(board)
+        expected = len(PuzzleSolver(puzzle, engine="ida", heuristic="linear_conflict").solve())
+        solver = PuzzleSolver(puzzle, engine="parallel", heuristic="linear_conflict", workers=2)
+        moves = solver.solve()
+        assert len(moves) == expected
+        for move in moves:
+            assert puzzle.move(move)
+        assert puzzle.is_goal_state()
+        assert solver.stats.nodes_expanded > 0
+
+def test_parallel_engine_on_goal_and_short_boards():
+    assert PuzzleSolver(PuzzleState(), engine="parallel", workers=2).solve() == []
+    puzzle = PuzzleState([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 0, 15]])
+    assert PuzzleSolver(puzzle, engine="parallel", workers=2).solve() == [(3, 3)]
+
+def test_parallel_engine_respects_node_limit():
+    puzzle = PuzzleState([[15, 14, 13, 12], [11, 10, 9, 8], [7, 6, 5, 4], [3, 1, 2, 0]])
+    with pytest.raises(SearchLimitExceeded):
+        PuzzleSolver(puzzle, engine="parallel", node_limit=5000, workers=2).solve()
@@ -0,0 +1,49 @@
+import pytest
+from src.puzzle.board import GOAL, MANHATTAN, unpack
+from src.puzzle.pattern_database import PatternDatabase, build_database
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.solver import PuzzleSolver
+
+PATTERNS = ((1, 2, 3), (4, 7, 8), (5, 6, 9), (10, 13, 14), (11, 12, 15))
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    path = tmp_path_factory.mktemp("pdb") / "pdb_33333.bin"
+    build_database(path, PATTERNS)
+    return PatternDatabase(path)
+
+def test_goal_is_zero(database):
+    assert database.evaluate(GOAL) == 0
+
+def test_dominates_manhattan(database):
+    for _ in range(20):
+        board = PuzzleState.create_random_state().to_packed()
+        distance = sum(MANHATTAN[tile][index] for index, tile in enumerate(unpack(board)))
+        assert database.evaluate(board) >= distance
+
+def test_solver_with_pattern_database(database):
+    puzzle = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    expected = len(PuzzleSolver(puzzle, engine="ida").solve())
+    assert len(PuzzleSolver(puzzle, engine="ida", heuristic=database).solve()) == expected
+    assert len(PuzzleSolver(puzzle, heuristic=database).solve()) == expected
+
+def test_missing_database_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        PatternDatabase(tmp_path / "missing.bin").evaluate(GOAL)
+
+def test_overlapping_patterns_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        build_database(tmp_path / "bad.bin", ((1, 2), (2, 3)))
+
+def test_incremental_update_matches_full_evaluation(database):
+    puzzle = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    board = puzzle.to_packed()
+    h, context = database.initial(board)
+    # Slide the blank up the left column: tiles 13, 9 and 5 move down.
+    blank = 12
+    for target in (8, 4, 0):
+        tile = (board >> (target * 4)) & 0xF
+        board = board ^ (tile << (target * 4)) ^ (tile << (blank * 4))
+        h, context = database.update(context, board, tile, target, blank)
+        blank = target
+        assert h == database.evaluate(board)
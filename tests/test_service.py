@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+from src.puzzle.cache import reflect
+from src.puzzle.puzzle_state import PuzzleState
+from src.service import SolveService
+
+BOARD = [5, 1, 2, 3, 9, 6, 7, 4, 13, 10, 11, 8, 0, 14, 15, 12]
+
+def replay(tiles, moves):
+    size = int(len(tiles) ** 0.5)
+    state = PuzzleState([tiles[i:i + size] for i in range(0, len(tiles), size)])
+    offsets = {"R": (0, 1), "D": (1, 0), "L": (0, -1), "U": (-1, 0)}
+    for move in moves:
+        row, col = state.blank_position
+        assert state.move((row + offsets[move][0], col + offsets[move][1]))
+    return state
+
+async def request(address, method, path, payload=None):
+    reader, writer = await asyncio.open_connection(*address)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data)
+
+def test_service_coalesces_mirrored_boards():
+    async def scenario():
+        service = SolveService(workers=1)
+        await service.start(port=0)
+        try:
+            mirrored = PuzzleState.from_packed(reflect(PuzzleState([BOARD[i:i + 4] for i in range(0, 16, 4)]).to_packed()))
+            mirrored = [tile for row in mirrored.state for tile in row]
+            first, second = await asyncio.gather(
+                request(service.address, "POST", "/solve", {"board": BOARD, "engine": "ida"}),
+                request(service.address, "POST", "/solve", {"board": mirrored, "engine": "ida"}),
+            )
+            metrics = await request(service.address, "GET", "/metrics")
+            unsolvable = await request(service.address, "POST", "/solve", {"board": list(range(1, 14)) + [15, 14, 0]})
+            bad = await request(service.address, "POST", "/solve", {"board": [1, 2, 3]})
+        finally:
+            await service.close()
+        return first, second, metrics, unsolvable, bad
+
+    first, second, metrics, unsolvable, bad = asyncio.run(scenario())
+    assert first[0] == second[0] == 200
+    assert first[1]["length"] == second[1]["length"] == 9
+    assert replay(BOARD, first[1]["moves"]).is_goal_state()
+    assert sorted([first[1]["coalesced"], second[1]["coalesced"]]) == [False, True]
+    assert metrics[1]["solves"] == 1 and metrics[1]["coalesced"] == 1
+    assert metrics[1]["latency"]["count"] == 2
+    assert unsolvable[0] == 422 and bad[0] == 400
+
+def test_service_backpressure_and_deadlines():
+    async def scenario():
+        # No dispatchers running: queued solves never start.
+        service = SolveService(queue_size=1)
+        waiting = asyncio.create_task(service.solve({"board": BOARD, "timeout": 0.05}))
+        await asyncio.sleep(0)
+        rejected = await service.solve({"board": list(range(1, 16)) + [0]})
+        return await waiting, rejected, service.metrics()
+
+    waiting, rejected, metrics = asyncio.run(scenario())
+    assert waiting[0] == 504
+    assert rejected[0] == 503
+    assert metrics["rejected"] == 1 and metrics["timeouts"] == 1 and metrics["queue_depth"] == 1
+
+def test_coalesced_requests_keep_their_own_deadlines():
+    async def scenario():
+        # No dispatchers running, so jobs stay queued until marked as started.
+        service = SolveService(queue_size=4)
+        short = asyncio.create_task(service.solve({"board": BOARD, "timeout": 0.05}))
+        await asyncio.sleep(0)
+        (job,) = service.jobs.values()
+        first_deadline = job.deadline
+        long = asyncio.create_task(service.solve({"board": BOARD, "timeout": 30}))
+        await asyncio.sleep(0)
+        extended = job.deadline - first_deadline
+
+        # A running job's time limit is fixed, so a longer request starts its own solve.
+        job.started = True
+        job.deadline = first_deadline
+        later = asyncio.create_task(service.solve({"board": BOARD, "timeout": 30}))
+        await asyncio.sleep(0)
+        replaced = service.jobs[job.key] is not job
+        await short
+        for task in (long, later):
+            task.cancel()
+        await asyncio.gather(long, later, return_exceptions=True)
+        return extended, replaced, service.metrics()
+
+    extended, replaced, metrics = asyncio.run(scenario())
+    assert extended > 29
+    assert replaced
+    assert metrics["coalesced"] == 1 and metrics["queue_depth"] == 2
+
+def test_service_rejects_malformed_payloads():
+    async def scenario():
+        service = SolveService(workers=1)
+        await service.start(port=0)
+
+        async def broken_route(method, path, body):
+            raise RuntimeError("boom")
+
+        try:
+            payloads = [
+                {"board": [None] + BOARD[1:]},
+                {"board": {"tiles": BOARD}},
+                {"board": BOARD, "timeout": None},
+                {"board": BOARD, "timeout": "5"},
+                {"board": BOARD, "timeout": 0},
+                {"board": BOARD, "timeout": -1},
+                {"board": BOARD, "timeout": float("inf")},
+                {"board": BOARD, "timeout": float("nan")},
+                {"board": BOARD, "engine": ["ida"]},
+                {"board": BOARD, "heuristic": 3},
+            ]
+            responses = [await request(service.address, "POST", "/solve", payload) for payload in payloads]
+            metrics = (await request(service.address, "GET", "/metrics"))[1]
+            service._route = broken_route
+            crashed = await request(service.address, "GET", "/health")
+        finally:
+            await service.close()
+        return responses, metrics, crashed
+
+    responses, metrics, crashed = asyncio.run(scenario())
+    assert [status for status, _ in responses] == [400] * len(responses)
+    assert all("error" in body for _, body in responses)
+    assert metrics["latency"]["count"] == len(responses)
+    assert crashed == (500, {"error": "Internal server error"})
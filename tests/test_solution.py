@@ -0,0 +1,41 @@
+import pytest
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.solution import Solution
+from src.puzzle.solver import PuzzleSolver
+
+PUZZLE = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+
+def test_solution_round_trips_moves():
+    moves = PuzzleSolver(PUZZLE).solve()
+    solution = Solution.from_moves(PUZZLE, moves)
+    assert len(solution) == 9
+    assert len(solution.data) == 3  # four moves per byte
+    assert list(solution.moves()) == moves
+    assert str(solution) == "UUURRRDDD"
+
+def test_solution_replays_states_lazily():
+    solution = PuzzleSolver(PUZZLE).get_solution()
+    states = solution.states()
+    assert next(states) == PUZZLE
+    assert list(states)[-1].is_goal_state()
+
+def test_solution_serialization():
+    puzzle = PuzzleState([[1, 2, 3], [4, 0, 6], [7, 5, 8]])
+    solution = Solution.from_moves(puzzle, [(2, 1), (2, 2)])
+    restored = Solution.from_bytes(solution.to_bytes())
+    assert restored == solution
+    assert list(restored.states())[-1].is_goal_state()
+    with pytest.raises(ValueError):
+        Solution.from_bytes(solution.to_bytes()[:-1])
+
+def test_solution_rejects_non_adjacent_moves():
+    with pytest.raises(ValueError, match="not adjacent"):
+        Solution.from_moves(PuzzleState(), [(3, 3), (2, 0)])
+
+def test_solution_rejects_moves_off_the_board():
+    goal = PuzzleState().to_packed()
+    with pytest.raises(ValueError, match="not adjacent"):
+        Solution.from_cells(goal, [14, 13, 12, 16])
+    top = PuzzleState([[1, 0, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11], [12, 13, 14, 15]]).to_packed()
+    with pytest.raises(ValueError, match="not adjacent"):
+        Solution.from_cells(top, [-3])
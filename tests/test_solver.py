@@ -1,6 +1,8 @@
 import pytest
+from src.puzzle.generator import generate_boards
 from src.puzzle.puzzle_state import PuzzleState
-from src.puzzle.solver import PuzzleSolver
+from src.puzzle.limits import SearchLimitExceeded
+from src.puzzle.solver import ASTAR_NODE_BYTES, PuzzleSolver
 
 def test_solver_with_goal_state():
     puzzle = PuzzleState()
@@ -19,4 +21,91 @@ def test_solver_with_random_state():
     solver = PuzzleSolver(puzzle)
     solution = solver.solve()
     assert solution is not None
-    assert puzzle.is_goal_state()  # Solution leads to goal state
\ No newline at end of file
+    assert puzzle.is_goal_state()  # Solution leads to goal state
+
+def test_solver_with_short_scramble():
+    puzzle = PuzzleState([[1, 2, 3, 4], [5, 6, 0, 8], [9, 10, 7, 12], [13, 14, 11, 15]])
+    solver = PuzzleSolver(puzzle)
+    solution = solver.solve()
+    assert solution == [(2, 2), (3, 2), (3, 3)]
+
+    states = solver.get_solution_states()
+    assert states[0] == puzzle
+    assert states[-1].is_goal_state()
+    assert len(states) == len(solution) + 1
+
+
+def test_ida_star_matches_astar_length():
+    puzzle = PuzzleState([[1, 2, 3, 4], [5, 6, 7, 8], [0, 10, 11, 12], [9, 13, 14, 15]])
+    astar = PuzzleSolver(puzzle).solve()
+    ida = PuzzleSolver(puzzle, engine="ida").solve()
+    assert len(ida) == len(astar) == 4
+    assert PuzzleSolver(puzzle, engine="ida").get_solution_states()[-1].is_goal_state()
+
+def test_ida_star_with_deeper_scramble():
+    puzzle = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    solution = PuzzleSolver(puzzle, engine="ida").solve()
+    assert len(solution) == len(PuzzleSolver(puzzle).solve()) == 9
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown engine"):
+        PuzzleSolver(PuzzleState(), engine="bfs")
+
+def test_solver_node_limit():
+    puzzle = PuzzleState([[15, 14, 13, 12], [11, 10, 9, 8], [7, 6, 5, 4], [3, 1, 2, 0]])
+    for engine in ("astar", "ida"):
+        solver = PuzzleSolver(puzzle, engine=engine, node_limit=500)
+        with pytest.raises(SearchLimitExceeded):
+            solver.solve()
+        assert solver.nodes_expanded == 501
+
+def test_anytime_converges_to_optimal_without_limits():
+    puzzle = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    result = PuzzleSolver(puzzle).solve_anytime(weight=3.0)
+    assert result.optimal
+    assert result.length == result.lower_bound == 9
+
+def test_anytime_reports_bound_under_node_limit():
+    puzzle = PuzzleState([[15, 14, 13, 12], [11, 10, 9, 8], [7, 6, 5, 4], [3, 1, 2, 0]])
+    solver = PuzzleSolver(puzzle, node_limit=20000)
+    result = solver.solve_anytime(weight=3.0)
+    assert result.solutions_found >= 1
+    assert result.lower_bound <= result.length
+
+    board = puzzle
+    for move in result.moves:
+        assert board.move(move)
+    assert board.is_goal_state()
+
+def test_solver_reports_stats():
+    puzzle = PuzzleState([[5, 1, 2, 3], [9, 6, 7, 4], [13, 10, 11, 8], [0, 14, 15, 12]])
+    solver = PuzzleSolver(puzzle, profile=True)
+    solver.solve()
+    stats = solver.stats
+    assert stats.engine == "astar" and stats.heuristic == "manhattan"
+    assert stats.solution_length == 9
+    assert stats.nodes_generated >= stats.nodes_expanded > 0
+    assert stats.peak_frontier > 0
+    assert stats.heuristic_time is not None and stats.peak_memory > 0
+
+def test_memory_limit_falls_back_to_optimal_ida():
+    puzzle = PuzzleState([[6, 7, 15, 3], [5, 1, 11, 4], [0, 9, 8, 2], [13, 10, 14, 12]])
+    optimal = PuzzleSolver(puzzle).solve()
+    solver = PuzzleSolver(puzzle, memory_limit=200 * ASTAR_NODE_BYTES)
+    solution = solver.solve()
+    assert len(solution) == len(optimal) == 30
+    assert solver.get_solution_states()[-1].is_goal_state()
+    assert solver.stats.nodes_generated > 200
+
+def test_anytime_lower_bound_is_sound_under_any_node_limit():
+    for seed in range(8):
+        tiles = generate_boards(1, depth=24, seed=seed)[0].tolist()
+        puzzle = PuzzleState([tiles[i:i + 4] for i in range(0, 16, 4)])
+        optimal = len(PuzzleSolver(puzzle).solve())
+        for node_limit in range(1, 60):
+            try:
+                result = PuzzleSolver(puzzle, node_limit=node_limit).solve_anytime(weight=1.5)
+            except SearchLimitExceeded:
+                continue
+            assert result.lower_bound <= optimal <= result.length
+            assert not result.optimal or result.length == optimal
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+from src.puzzle.puzzle_state import PuzzleState
+from src.puzzle.solver import PuzzleSolver
+from src.puzzle.staged import StagedSolver
+
+def replay(puzzle, moves):
+    state = PuzzleState([row[:] for row in puzzle.state])
+    for move in moves:
+        assert state.move(move)
+    return state
+
+def test_nxn_goal_and_solvability():
+    assert PuzzleState(size=3).state == [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+    assert PuzzleState(size=5).is_goal_state()
+    assert not PuzzleState([[2, 1, 3], [4, 5, 6], [7, 8, 0]]).is_solvable()
+    assert PuzzleState([[1, 2, 3], [4, 5, 6], [0, 7, 8]]).is_solvable()
+    assert PuzzleState.create_random_state(5).size == 5
+
+def test_nxn_packed_conversion():
+    puzzle = PuzzleState.create_random_state(6)
+    assert PuzzleState.from_packed(puzzle.to_packed(), 6) == puzzle
+
+@pytest.mark.parametrize("size", [2, 3, 4, 5, 7, 10])
+def test_staged_solver_reaches_goal(size):
+    random.seed(size)
+    for _ in range(5):
+        puzzle = PuzzleState.create_random_state(size)
+        assert replay(puzzle, StagedSolver(puzzle).solve()).is_goal_state()
+
+def test_staged_solver_is_optimal_on_small_boards():
+    puzzle = PuzzleState([[1, 2, 3], [4, 0, 6], [7, 5, 8]])
+    assert StagedSolver(puzzle).solve() == [(2, 1), (2, 2)]
+
+def test_staged_engine_in_puzzle_solver():
+    random.seed(0)
+    puzzle = PuzzleState.create_random_state(8)
+    solver = PuzzleSolver(puzzle, engine="staged")
+    states = solver.get_solution_states()
+    assert states[0] == puzzle
+    assert states[-1].is_goal_state()
+    assert solver.stats.solution_length == len(states) - 1
+
+def test_optimal_engines_reject_other_sizes():
+    with pytest.raises(ValueError, match="engine='staged'"):
+        PuzzleSolver(PuzzleState(size=5), engine="ida")